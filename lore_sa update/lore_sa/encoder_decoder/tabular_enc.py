@@ -237,7 +237,23 @@ class ColumnTransformerEnc(EncDec):
     def encode_target_class(self, X: np.array):
         """
         Encode the target class
-        :param X:
-        :return:
+
+        The fitted ordinal encoder keeps its categories sorted, so labels are
+        mapped to codes with a single vectorized binary search. Labels that
+        are not known to the encoder go through the ordinal encoder, which
+        reports them as usual.
+
+        :param [Numpy array] X: Column array (n, 1) of target class labels
+        :return [Numpy array]: Column array (n, 1) of encoded target classes
         """
-        return self.target_encoder.transform(X)
+        X = np.asarray(X)
+        classes = self.target_encoder.categories_[0]
+        labels = X.reshape(-1)
+        try:
+            codes = np.searchsorted(classes, labels)
+        except TypeError:
+            return self.target_encoder.transform(X)
+        codes = np.minimum(codes, len(classes) - 1)
+        if not np.array_equal(classes[codes], labels):
+            return self.target_encoder.transform(X)
+        return codes.astype(self.target_encoder.dtype).reshape(-1, 1)
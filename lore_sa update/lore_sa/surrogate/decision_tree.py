@@ -142,7 +142,8 @@ class DecisionTreeSurrogate(Surrogate):
         node_index = self.dt.decision_path(z).indices
 
         feature_names = list(encoder.encoded_features.values())
-        numeric_columns = list(encoder.encoded_descriptor['numeric'].keys())
+        # set for O(1) membership tests along the decision path
+        numeric_columns = set(encoder.encoded_descriptor['numeric'].keys())
 
         premises = list()
         for node_id in node_index:
@@ -162,10 +162,42 @@ export const fetchExplanation = async (requestData) => {
     const response = await fetchJSON(`${API_BASE}/explain`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify(requestData),
+        body: JSON.stringify({ ...requestData, columnarOriginalData: true }),
     });
     console.log(response)
-    return response;
+    return expandOriginalData(response);
+};
+
+/**
+ * Rebuilds per-point records from a columnar scatter plot payload.
+ * The server sends originalData as { feature: [values...] } so that feature
+ * names travel once; the visualizations index it per point.
+ * 
+ * @param {Object} result - Response containing scatterPlotVisualizationData
+ * @returns {Object} The same response with originalData as an array of objects
+ * @example
+ * expandOriginalData({ scatterPlotVisualizationData: { originalData: { a: [1, 2] } } });
+ * // originalData becomes: [{ a: 1 }, { a: 2 }]
+ */
+const expandOriginalData = (result) => {
+    const scatterData = result?.scatterPlotVisualizationData;
+    const columns = scatterData?.originalData;
+    if (!columns || Array.isArray(columns)) {
+        return result;
+    }
+
+    const names = Object.keys(columns);
+    const length = names.length > 0 ? columns[names[0]].length : 0;
+    const rows = new Array(length);
+    for (let i = 0; i < length; i++) {
+        const row = {};
+        for (const name of names) {
+            row[name] = columns[name][i];
+        }
+        rows[i] = row;
+    }
+    scatterData.originalData = rows;
+    return result;
 };
 
 /**
@@ -215,7 +247,7 @@ export async function fetchVisualizationUpdate(requestData) {
             headers: {
                 "Content-Type": "application/json",
             },
-            body: JSON.stringify(requestData),
+            body: JSON.stringify({ ...requestData, columnarOriginalData: true }),
         });
 
         if (!response.ok) {
@@ -227,7 +259,7 @@ export async function fetchVisualizationUpdate(requestData) {
 
         const result = await response.json();
         
-        return result;
+        return expandOriginalData(result);
     } catch (error) {
         console.error("Error updating visualization:", error);
         throw error;
@@ -224,14 +224,18 @@ async function handleScatterPlotMethodChange(event) {
     showExplanationLoading();
     try {
         const requestData = buildVisualizationRequestData(event.target.value);
-        const result = await fetchVisualizationUpdate(requestData);
+        const result = await resolveReductionFallback(
+            await fetchVisualizationUpdate(requestData),
+            event.target.value
+        );
+        const methodUsed = result.scatterPlotVisualizationData?.methodUsed || event.target.value;
 
-        await initializeColors(event.target.value);
+        await initializeColors(methodUsed);
         setGlobalColorMap(result.uniqueClasses);
         
         updateVisualizationUI();
         document.querySelector(
-            `input[name="scatterPlotMethod"][value="${event.target.value}"]`
+            `input[name="scatterPlotMethod"][value="${methodUsed}"]`
         ).checked = true;
         updateVisualizations(result);
     } catch (error) {
@@ -276,6 +280,48 @@ function buildVisualizationRequestData(selectedMethod) {
     };
 }
 
+/**
+ * Lets the user decide what happens when the server projected with UMAP
+ * instead of the requested t-SNE or MDS, which are too slow on large point sets.
+ * Either the requested method is computed anyway or the UMAP radio button is
+ * selected, so the scatter plot is never labelled with a method it was not
+ * computed with.
+ * 
+ * @async
+ * @param {Object} result - Response of /explain or /update-visualization
+ * @param {string} requestedMethod - Method selected by the user
+ * @returns {Promise<Object>} The response to display
+ * @example
+ * const shown = await resolveReductionFallback(result, 'tsne');
+ * // shown.scatterPlotVisualizationData.methodUsed is 'tsne' or 'umap'
+ * 
+ * @see fetchVisualizationUpdate
+ */
+export async function resolveReductionFallback(result, requestedMethod) {
+    const methodUsed = result.scatterPlotVisualizationData?.methodUsed;
+    if (!methodUsed || methodUsed.toLowerCase() === requestedMethod.toLowerCase()) {
+        return result;
+    }
+
+    const requestedLabel = requestedMethod.toLowerCase() === "mds" ? "MDS" : "t-SNE";
+    const computeAnyway = window.confirm(
+        `${requestedLabel} is slow on this many points, so the scatter plot was computed with UMAP.\n\n` +
+        `Press OK to compute ${requestedLabel} anyway (this can take a while), or Cancel to keep UMAP.`
+    );
+
+    if (computeAnyway) {
+        const forced = await fetchVisualizationUpdate({
+            ...buildVisualizationRequestData(requestedMethod),
+            forceReductionMethod: true,
+        });
+        return { ...result, ...forced };
+    }
+
+    const umapRadio = document.querySelector(`input[name="scatterPlotMethod"][value="${methodUsed}"]`);
+    if (umapRadio) umapRadio.checked = true;
+    return result;
+}
+
 /**
  * Updates visualizations with new data while preserving instance highlighting.
  * Clears existing visualizations and recreates them with updated data.
@@ -19,7 +19,7 @@ import {
     getAllDimensionalityReductionParameters, // Import new function
 } from "./jsHelpers/ui.js";
 
-import { initializeVisualizations } from "./jsHelpers/visualizations.js";
+import { initializeVisualizations, resolveReductionFallback } from "./jsHelpers/visualizations.js";
 import { updateParameter, loadingState } from "./jsHelpers/stateManagement.js";
 import {
     setExplainedInstance,
@@ -349,7 +349,8 @@ window.explainInstance = async () => {
             requestData = buildUnifiedExplanationRequestData(instanceData, surrogateParams, appState);
         }
         
-        const result = await fetchExplanation(requestData);
+        const requestedMethod = requestData.scatterPlotMethod;
+        const result = await resolveReductionFallback(await fetchExplanation(requestData), requestedMethod);
 
         const methodElement = document.querySelector('input[name="scatterPlotMethod"]:checked');
         const currentMethod = methodElement ? methodElement.value : 'umap';
@@ -1,5 +1,8 @@
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple, Union
+import hashlib
+from collections import OrderedDict
 import numpy as np
+import pandas as pd
 import logging
 logging.getLogger('numba').setLevel(logging.WARNING)
 from fastapi import APIRouter
@@ -41,6 +44,9 @@ COLOR_BLIND_FRIENDLY_COLORS = [
 
 router = APIRouter(prefix="/api")
 
+projection_memo_size = 32
+_projection_memo: 'OrderedDict[Tuple, np.ndarray]' = OrderedDict()
+
 
 def compute_centroids(X: np.ndarray, y: np.ndarray) -> Dict[int, np.ndarray]:
     """
@@ -57,26 +63,192 @@ def compute_centroids(X: np.ndarray, y: np.ndarray) -> Dict[int, np.ndarray]:
     -------
     Dict[int, np.ndarray]
         Mapping from class labels to centroid coordinates.
+        
+    Notes
+    -----
+    Dict view of ``compute_centroid_matrix``, kept for callers that look
+    centroids up by label.
+    """
+    classes, centroid_matrix = compute_centroid_matrix(X, y)
+    return dict(zip(classes, centroid_matrix))
+
+
+def compute_centroid_matrix(X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    unique_classes = np.unique(y)
-    centroids = {}
+    Calculate class centroids as one matrix.
     
-    for cls in unique_classes:
-        class_samples = X[y == cls]
-        centroids[cls] = np.mean(class_samples, axis=0)
+    Parameters
+    ----------
+    X : np.ndarray
+        Feature matrix with shape (n_samples, n_features).
+    y : np.ndarray
+        Class labels with shape (n_samples,).
+        
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Sorted class labels and centroids with shape (n_classes, n_features),
+        row i belonging to label i.
+        
+    Notes
+    -----
+    Labels are mapped to integer codes with one factorize pass, then the
+    per-class sums of every feature come from ``np.bincount`` with the
+    feature as weights. No sort of X and no per-class mask or copy of X
+    is needed.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    codes, classes = pd.factorize(np.asarray(y), sort=True)
+    n_classes = len(classes)
+    counts = np.bincount(codes, minlength=n_classes)
+    sums = np.empty((n_classes, X.shape[1]))
+    for j in range(X.shape[1]):
+        sums[:, j] = np.bincount(codes, weights=X[:, j], minlength=n_classes)
     
-    return centroids
+    sums /= counts[:, None]
+    return classes, sums
 
 
-def project_to_rgb(centroids: Dict[int, np.ndarray], method: str, parameters: dict = None,
+def _centroid_labels_and_matrix(centroids: Union[Dict[int, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+                                ) -> Tuple[List[Any], np.ndarray]:
+    """
+    Split centroids into labels and a float32 matrix.
+    
+    Parameters
+    ----------
+    centroids : Union[Dict[int, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+        Mapping from labels to centroids, or the ``(labels, matrix)`` pair
+        returned by ``compute_centroid_matrix``.
+        
+    Returns
+    -------
+    Tuple[List[Any], np.ndarray]
+        Labels and centroids with shape (n_classes, n_features), row i
+        belonging to label i.
+    """
+    if isinstance(centroids, dict):
+        labels = list(centroids.keys())
+        return labels, np.array([centroids[label] for label in labels], dtype=np.float32)
+    labels, centroid_matrix = centroids
+    return list(labels), np.asarray(centroid_matrix, dtype=np.float32)
+
+
+def _rescale_unit(values: np.ndarray) -> np.ndarray:
+    """
+    Rescale every column to the [0, 1] range.
+    
+    Parameters
+    ----------
+    values : np.ndarray
+        Reduced centroid coordinates with shape (n_classes, n_components).
+        
+    Returns
+    -------
+    np.ndarray
+        Min-max scaled coordinates; constant columns map to 0, as with
+        MinMaxScaler.
+        
+    Notes
+    -----
+    Replaces fitting a MinMaxScaler for a handful of rows with two
+    reductions and an in-place rescale.
+    """
+    values = np.array(values, dtype=np.float64)
+    minimum = values.min(axis=0)
+    span = values.max(axis=0) - minimum
+    span[span == 0.0] = 1.0
+    values -= minimum
+    values /= span
+    return np.clip(values, 0, 1, out=values)
+
+
+def _reduce_centroids(centroid_matrix: np.ndarray, method: str, n_components: int,
+                      parameters: dict, random_state: int) -> np.ndarray:
+    """
+    Reduce centroids to ``n_components`` dimensions with the chosen method.
+    
+    Parameters
+    ----------
+    centroid_matrix : np.ndarray
+        Class centroids with shape (n_classes, n_features).
+    method : str
+        Dimensionality reduction method ('pca', 'tsne', 'umap', 'mds').
+    n_components : int
+        Number of output dimensions.
+    parameters : dict
+        Method-specific parameters (same as used for scatter plot).
+    random_state : int
+        Random seed for reproducible results.
+        
+    Returns
+    -------
+    np.ndarray
+        Centroids with exactly ``n_components`` columns. Centroids that
+        already have at most that many features are not reduced, only
+        padded with zero columns (which rescale to 0).
+        
+    Notes
+    -----
+    There is one centroid per class, so PCA defaults to the exact
+    ``svd_solver='full'``; randomized SVD brings no speed-up on a matrix
+    this small and only adds variance. Reductions are memoized on a hash
+    of the centroid bytes together with the method and its parameters
+    (``projection_memo_size`` entries), so repeated requests on the same
+    centroids skip refitting t-SNE, UMAP or MDS. The reducers receive the
+    centroids in float32, which is ample for a colour mapping and halves
+    the data moved through the SVD or neighbour search. UMAP keeps its
+    seed, and with it single-threaded execution, so class colours stay
+    stable across requests; its neighbour count is capped at the number
+    of centroids.
+    """
+    n_features = centroid_matrix.shape[1]
+    if n_features == n_components:
+        return centroid_matrix
+    if n_features < n_components:
+        padded = np.zeros((centroid_matrix.shape[0], n_components))
+        padded[:, :n_features] = centroid_matrix
+        return padded
+    
+    if method.lower() == 'pca' and 'svd_solver' not in parameters:
+        parameters = {**parameters, 'svd_solver': 'full'}
+    
+    centroid_matrix = np.ascontiguousarray(centroid_matrix, dtype=np.float32)
+    key = (
+        hashlib.blake2b(centroid_matrix.tobytes(), digest_size=16).hexdigest(),
+        centroid_matrix.shape, method, n_components, 
+        repr(sorted(parameters.items())), random_state
+    )
+    if key in _projection_memo:
+        _projection_memo.move_to_end(key)
+        return _projection_memo[key].copy()
+    
+    reducer = create_dimensionality_reducer(method, n_components, parameters, random_state)
+    if method.lower() == 'umap':
+        # A handful of centroids: the kNN graph cannot exceed n - 1
+        # neighbours and the spectral init needs more than n_components + 1
+        # points, so use a random init on tiny class counts.
+        n_centroids = centroid_matrix.shape[0]
+        reducer.set_params(n_neighbors=max(2, min(reducer.n_neighbors, n_centroids - 1)))
+        if n_centroids <= n_components + 1:
+            reducer.set_params(init='random')
+    reduced = reducer.fit_transform(centroid_matrix)
+    
+    _projection_memo[key] = reduced
+    while len(_projection_memo) > projection_memo_size:
+        _projection_memo.popitem(last=False)
+    return reduced.copy()
+
+
+def project_to_rgb(centroids: Union[Dict[int, np.ndarray], Tuple[np.ndarray, np.ndarray]], method: str, parameters: dict = None,
                   random_state: int = 42) -> Dict[int, np.ndarray]:
     """
     Project high-dimensional centroids to RGB color space using consistent parameters.
     
     Parameters
     ----------
-    centroids : Dict[int, np.ndarray]
-        Class centroids in original feature space.
+    centroids : Union[Dict[int, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+        Class centroids in original feature space, as a mapping from labels
+        or as the ``(labels, matrix)`` pair from ``compute_centroid_matrix``.
     method : str
         Dimensionality reduction method ('pca', 'tsne', 'umap', 'mds').
     parameters : dict, default=None
@@ -92,24 +264,15 @@ def project_to_rgb(centroids: Dict[int, np.ndarray], method: str, parameters: di
     Notes
     -----
     Reduces centroids to 3D space then maps to RGB color channels.
-    Uses MinMaxScaler to ensure valid RGB ranges.
+    Min-max scales each channel to ensure valid RGB ranges.
     """
     if parameters is None:
         parameters = {}
         
-    labels = list(centroids.keys())
-    centroid_matrix = np.array([centroids[label] for label in labels])
-    
-    if centroid_matrix.shape[1] > 3:
-        reducer = create_dimensionality_reducer(method, 3, parameters, random_state)
-        reduced_centroids = reducer.fit_transform(centroid_matrix)
-    else:
-        reduced_centroids = centroid_matrix
+    labels, centroid_matrix = _centroid_labels_and_matrix(centroids)
     
-    from sklearn.preprocessing import MinMaxScaler
-    scaler = MinMaxScaler(feature_range=(0, 1))
-    rgb_values = scaler.fit_transform(reduced_centroids)
-    rgb_values = np.clip(rgb_values, 0, 1)
+    reduced_centroids = _reduce_centroids(centroid_matrix, method, 3, parameters, random_state)
+    rgb_values = _rescale_unit(reduced_centroids)
     
     colors = {label: rgb_values[i] for i, label in enumerate(labels)}
     return colors
@@ -138,23 +301,50 @@ def cielab_hex_from_xy(x: float, y: float, L: int = 70) -> str:
     Maps 2D coordinates to perceptually uniform CIELAB color space,
     then converts to RGB hex representation.
     """
-    a = ((x-0.5)*2) * 128  
-    b = ((y-0.5)*2) * 128
-    lab = np.array([L, a, b])[None, None, :]
-    rgb = color.lab2rgb(lab)[0,0,:]
-    rgb = np.clip(rgb, 0, 1)
-    return "#{:02x}{:02x}{:02x}".format(int(rgb[0]*255), int(rgb[1]*255), int(rgb[2]*255))
+    return cielab_hex_from_xy_array(np.array([[x, y]]), L)[0]
+
+
+def cielab_hex_from_xy_array(xy_values: np.ndarray, L: int = 70) -> List[str]:
+    """
+    Convert many 2D coordinates to hex colors using CIELAB color space.
+    
+    Parameters
+    ----------
+    xy_values : np.ndarray
+        Coordinates in [0, 1] range with shape (n_points, 2).
+    L : int, default=70
+        Lightness value for CIELAB conversion.
+        
+    Returns
+    -------
+    List[str]
+        Hex color strings in format "#RRGGBB", one per point.
+        
+    Notes
+    -----
+    All points go through a single ``lab2rgb`` call and are truncated to
+    uint8 channels in one step, leaving only the string formatting per
+    point.
+    """
+    xy_values = np.asarray(xy_values, dtype=np.float64)
+    lab = np.empty((1, len(xy_values), 3))
+    lab[0, :, 0] = L
+    lab[0, :, 1:] = (xy_values - 0.5) * 2 * 128
+    rgb = np.clip(color.lab2rgb(lab)[0], 0, 1)
+    rgb_u8 = (rgb * 255).astype(np.uint8)
+    return ['#%02x%02x%02x' % (r, g, b) for r, g, b in rgb_u8.tolist()]
 
 
-def project_to_cielab(centroids: Dict[int, np.ndarray], method: str, parameters: dict = None,
+def project_to_cielab(centroids: Union[Dict[int, np.ndarray], Tuple[np.ndarray, np.ndarray]], method: str, parameters: dict = None,
                      random_state: int = 42) -> List[str]:
     """
     Project centroids to 2D space and generate CIELAB-based hex colors using consistent parameters.
     
     Parameters
     ----------
-    centroids : Dict[int, np.ndarray]
-        Class centroids in original feature space.
+    centroids : Union[Dict[int, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+        Class centroids in original feature space, as a mapping from labels
+        or as the ``(labels, matrix)`` pair from ``compute_centroid_matrix``.
     method : str
         Dimensionality reduction method ('pca', 'tsne', 'umap', 'mds').
     parameters : dict, default=None
@@ -175,26 +365,44 @@ def project_to_cielab(centroids: Dict[int, np.ndarray], method: str, parameters:
     if parameters is None:
         parameters = {}
         
-    labels = list(centroids.keys())
-    centroid_matrix = np.array([centroids[label] for label in labels])
+    _, centroid_matrix = _centroid_labels_and_matrix(centroids)
     
-    if centroid_matrix.shape[1] > 2:
-        reducer = create_dimensionality_reducer(method, 2, parameters, random_state)
-        reduced_centroids = reducer.fit_transform(centroid_matrix)
-    else:
-        reduced_centroids = centroid_matrix
-        
-    from sklearn.preprocessing import MinMaxScaler
-    scaler = MinMaxScaler(feature_range=(0, 1))
-    xy_values = scaler.fit_transform(reduced_centroids)
-    xy_values = np.clip(xy_values, 0, 1)
+    reduced_centroids = _reduce_centroids(centroid_matrix, method, 2, parameters, random_state)
+    xy_values = _rescale_unit(reduced_centroids)
     
-    hex_colors = []
-    for x, y in xy_values:
-        hex_color = cielab_hex_from_xy(x, y)
-        hex_colors.append(hex_color)
+    return cielab_hex_from_xy_array(xy_values)
+
+
+def class_colors_cielab(X: np.ndarray, y: np.ndarray, method: str, parameters: dict = None,
+                        random_state: int = 42) -> List[str]:
+    """
+    Compute CIELAB class colors straight from labelled data.
     
-    return hex_colors
+    Parameters
+    ----------
+    X : np.ndarray
+        Feature matrix with shape (n_samples, n_features).
+    y : np.ndarray
+        Class labels with shape (n_samples,).
+    method : str
+        Dimensionality reduction method ('pca', 'tsne', 'umap', 'mds').
+    parameters : dict, default=None
+        Method-specific parameters (same as used for scatter plot).
+    random_state : int, default=42
+        Random seed for reproducible results.
+        
+    Returns
+    -------
+    List[str]
+        Hex color strings, one per class in sorted label order.
+        
+    Notes
+    -----
+    Equivalent to ``project_to_cielab(compute_centroids(X, y), ...)`` but
+    the centroid matrix goes straight to the reduction, without the
+    per-class dict and the re-stacking of its rows.
+    """
+    return project_to_cielab(compute_centroid_matrix(X, y), method, parameters, random_state)
 
 
 @router.get("/get-classes-colors")
@@ -218,14 +426,20 @@ async def get_colors(method: str, parameters: str = None) -> List[str]:
     -----
     For datasets with >10 classes, generates colors using centroid projection
     to CIELAB color space with the same parameters as scatter plot generation.
-    Otherwise returns predefined color palette.
+    Otherwise returns predefined color palette. Projected colors are kept in
+    ``webapp_state.classes_colors`` until the neighborhood or the reduction
+    parameters change, so repeated requests do not recompute them.
     """
     if len(webapp_state.target_names) > 10:
-        centroids = compute_centroids(
-            webapp_state.decoded_neighborhood,
-            webapp_state.neighb_predictions
-        )
-        colors = project_to_cielab(centroids, method, webapp_state.reduction_parameters)
+        colors = webapp_state.classes_colors.get(method)
+        if colors is None:
+            colors = class_colors_cielab(
+                webapp_state.decoded_neighborhood,
+                webapp_state.neighb_predictions,
+                method,
+                webapp_state.get_dimensionality_reduction_parameters(method)
+            )
+            webapp_state.classes_colors[method] = colors
         return colors
 
     return safe_json_response(COLOR_BLIND_FRIENDLY_COLORS[len(webapp_state.target_names)])
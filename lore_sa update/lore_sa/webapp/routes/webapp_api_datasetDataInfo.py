@@ -1,8 +1,16 @@
 from typing import Dict, Any, List
+import json
+import asyncio
 import numpy as np
 import pandas as pd
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..webapp_datasets import get_available_datasets, get_dataset_information, load_dataset
 from .webapp_api_state import webapp_state
@@ -10,6 +18,17 @@ from .webapp_api_utils import safe_json_response
 
 router = APIRouter(prefix="/api")
 
+# Rows serialized at a time when streaming a dataset to the client
+dataset_chunk_size = 1000
+
+# JSON body of the last fully streamed dataset with the objects it was built from
+_dataset_payload: Dict[str, Any] = {"ds": None, "feature_names": None, "body": None}
+
+# Serialized /get-datasets payload; the dataset registry is fixed at import time
+_datasets_payload: bytes = json.dumps(
+    {"datasets": list(get_available_datasets().keys())}, separators=(",", ":")
+).encode()
+
 
 @router.get("/get-datasets")
 async def get_datasets() -> Dict[str, List[str]]:
@@ -20,10 +39,13 @@ async def get_datasets() -> Dict[str, List[str]]:
     -------
     Dict[str, List[str]]
         Dictionary containing list of available dataset names.
+        
+    Notes
+    -----
+    The server readiness check polls this endpoint, so the body is
+    serialized once at import and the same bytes are returned every time.
     """
-    available_datasets = get_available_datasets()
-    dataset_names = list(available_datasets.keys())
-    return safe_json_response({"datasets": dataset_names})
+    return Response(content=_datasets_payload, media_type="application/json")
     
 
 @router.get("/get-dataset-info/{dataset_name_info}")
@@ -43,9 +65,11 @@ async def get_dataset_info(dataset_name_info: str) -> Dict[str, Any]:
         
     Notes
     -----
-    Updates webapp_state with dataset name and target information.
+    Updates webapp_state with dataset name and target information. The
+    information is read (or, on first use, computed and cached) in a worker
+    thread so the disk access does not block the event loop.
     """
-    dataset_info = get_dataset_information(dataset_name_info)
+    dataset_info = await asyncio.to_thread(get_dataset_information, dataset_name_info)
     
     webapp_state.dataset_name = dataset_info["name"]
     webapp_state.target_names = dataset_info["target_names"]
@@ -54,7 +78,7 @@ async def get_dataset_info(dataset_name_info: str) -> Dict[str, Any]:
     return safe_json_response(dataset_info)
     
 
-def process_tabular_dataset(ds: Any, feature_names: List[str]) -> JSONResponse:
+def process_tabular_dataset(ds: Any, feature_names: List[str]) -> Response:
     """
     Convert tabular dataset to JSON-serializable format.
     
@@ -67,18 +91,48 @@ def process_tabular_dataset(ds: Any, feature_names: List[str]) -> JSONResponse:
         
     Returns
     -------
-    JSONResponse
+    Response
         JSON response containing dataset records.
         
     Notes
     -----
     Handles NaN and infinite values by replacing with None for JSON compatibility.
     Converts dataset to list of record dictionaries for frontend consumption.
+    When orjson is installed the records are serialized by it directly:
+    it writes non-finite floats as null, so the object-dtype copy made by
+    ``replace`` is skipped, and the encoding runs in native code. The body
+    is then streamed ``dataset_chunk_size`` rows at a time, so only one
+    chunk of record dictionaries and its bytes exist at once and the
+    first rows are sent before the last ones are converted.
+    
+    Datasets do not change once loaded, so the streamed body is also kept
+    and sent as is while the same dataset object is requested again.
     """
-    df = pd.DataFrame(ds.data, columns=feature_names)
+    if (ORJSON_AVAILABLE and _dataset_payload["ds"] is ds
+            and _dataset_payload["feature_names"] == feature_names):
+        return Response(content=_dataset_payload["body"], media_type="application/json")
+    
+    df = pd.DataFrame(ds.data, columns=feature_names, copy=False)
     if hasattr(ds, "target"):
         df["target"] = ds.target
 
+    if ORJSON_AVAILABLE:
+        def dataset_chunks():
+            chunks = [b'{"dataset":[']
+            yield chunks[0]
+            for start in range(0, len(df), dataset_chunk_size):
+                records = df.iloc[start:start + dataset_chunk_size].to_dict(orient="records")
+                chunk = orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+                # Drop the list brackets so the chunks join into one array
+                chunks.append((b"," if start else b"") + chunk[1:-1])
+                yield chunks[-1]
+            chunks.append(b"]}")
+            yield chunks[-1]
+            # Only reached once the whole body was sent
+            _dataset_payload.update(ds=ds, feature_names=list(feature_names), body=b"".join(chunks))
+        
+        return StreamingResponse(dataset_chunks(), media_type="application/json")
+
     df = df.replace([np.inf, -np.inf], None)
 
     return JSONResponse(content={"dataset": df.to_dict(orient="records")})
@@ -98,8 +152,11 @@ async def get_selected_dataset() -> JSONResponse:
     -----
     Updates webapp_state with feature names from the loaded dataset.
     Requires that webapp_state.dataset_name has been set by previous calls.
+    Loading and serializing the dataset run in a worker thread so the event
+    loop keeps serving other requests meanwhile.
     """
-    ds, feature_names, target_names = load_dataset(webapp_state.dataset_name)
+    ds, feature_names, target_names = await asyncio.to_thread(load_dataset, webapp_state.dataset_name)
     webapp_state.feature_names = feature_names
     
-    return safe_json_response(process_tabular_dataset(ds, feature_names))
+    response = await asyncio.to_thread(process_tabular_dataset, ds, feature_names)
+    return safe_json_response(response)
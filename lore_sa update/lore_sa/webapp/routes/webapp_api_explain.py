@@ -2,20 +2,43 @@ from typing import Optional, Dict, Any, List, Tuple, Union
 import numpy as np
 import pandas as pd
 import os
+import asyncio
 from collections import OrderedDict
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from ..webapp_lore import create_neighbourhood_with_lore, train_surrogate
+from ...encoder_decoder import ColumnTransformerEnc
+from ...surrogate import DecisionTreeSurrogate
+from ..webapp_lore import (
+    DatasetProcessor, ExplanationCache, create_neighbourhood_with_lore, train_surrogate, persist_explanations
+)
 from ..webapp_generate_decision_tree_visualization_data import (
     extract_tree_structure,
     generate_decision_tree_visualization_data_raw
 )
 from ..webapp_create_scatter_plot_data import create_scatter_plot_data_raw
-from .webapp_api_state import webapp_state
-from .webapp_api_utils import safe_json_response
+from .webapp_api_state import webapp_state, webapp_state_lock
+from .webapp_api_utils import safe_json_response, FastJSONResponse
+
+# Explanation payloads carry the whole scatter plot and tree, so encode them with orjson
+router = APIRouter(prefix="/api", default_response_class=FastJSONResponse)
+
+# Last tree visualization with the surrogate and feature names it was built from
+_tree_data_cache: Dict[str, Any] = {"surrogate": None, "feature_names": None, "target_names": None, "data": None}
+
+# Tooltip records of the last neighborhood with the matrix and names they came from
+_neighborhood_records: Dict[str, Any] = {"rows": None, "feature_names": None, "records": None}
+
+# Last /update-visualization request with the state it read and the response it got
+_last_update: Dict[str, Any] = {"request": None, "inputs": None, "response": None}
 
-router = APIRouter(prefix="/api")
+# Recent scatter plots of the current neighborhood, keyed by visualization settings
+scatter_cache_size = 8
+_scatter_cache: 'OrderedDict[Tuple, Tuple[Tuple, Dict[str, Any]]]' = OrderedDict()
+
+# t-SNE and MDS scale quadratically with the number of projected points;
+# above this size they are replaced by UMAP unless the request forces them
+quadratic_reduction_max_points = 1500
 
 
 class InstanceRequest(BaseModel):
@@ -44,6 +67,11 @@ class InstanceRequest(BaseModel):
         Whether to include original training data in visualization.
     keepDuplicates : bool
         Whether to retain duplicate samples in neighborhood.
+    forceReductionMethod : bool
+        Use t-SNE or MDS even on large point sets instead of UMAP.
+    columnarOriginalData : bool
+        Send ``originalData`` as one list of values per encoded feature
+        instead of one dictionary per point.
     """
     instance: Dict[str, Any] = None
     dataset_name: str
@@ -55,6 +83,8 @@ class InstanceRequest(BaseModel):
     allMethodParameters: Dict[str, Dict[str, Any]] = {}
     includeOriginalDataset: bool
     keepDuplicates: bool
+    forceReductionMethod: bool = False
+    columnarOriginalData: bool = False
 
 
 class VisualizationRequest(BaseModel):
@@ -77,6 +107,11 @@ class VisualizationRequest(BaseModel):
         Parameters for all dimensionality reduction methods.
     includeOriginalDataset : bool
         Whether to overlay original training data.
+    forceReductionMethod : bool
+        Use t-SNE or MDS even on large point sets instead of UMAP.
+    columnarOriginalData : bool
+        Send ``originalData`` as one list of values per encoded feature
+        instead of one dictionary per point.
     """
     dataset_name: str
     scatterPlotStep: float
@@ -85,6 +120,8 @@ class VisualizationRequest(BaseModel):
     dimensionalityReductionParameters: Dict[str, Any] = {}
     allMethodParameters: Dict[str, Dict[str, Any]] = {}
     includeOriginalDataset: bool
+    forceReductionMethod: bool = False
+    columnarOriginalData: bool = False
 
 
 class InstanceProcessor:
@@ -100,13 +137,35 @@ class InstanceProcessor:
         List[str]
             Feature names ordered by their dataset indices.
         """
-        features = []
-        for name, info in webapp_state.dataset.descriptor['numeric'].items():
-            features.append((info['index'], name))
-        for name, info in webapp_state.dataset.descriptor['categorical'].items():
-            features.append((info['index'], name))
-        features.sort(key=lambda x: x[0])
-        return [name for _, name in features]
+        return DatasetProcessor(webapp_state.dataset).get_ordered_feature_names()
+    
+    @staticmethod
+    def order_instance(instance_dict: Dict[str, Any]) -> OrderedDict[str, Any]:
+        """
+        Arrange instance values in dataset index order.
+        
+        Parameters
+        ----------
+        instance_dict : Dict[str, Any]
+            Mapping from feature names to values.
+            
+        Returns
+        -------
+        OrderedDict[str, Any]
+            Instance features in correct order for model processing.
+            
+        Raises
+        ------
+        HTTPException
+            400 if the instance lacks some of the dataset's features.
+        """
+        processor = DatasetProcessor(webapp_state.dataset)
+        try:
+            values = processor.get_feature_getter()(instance_dict)
+        except KeyError:
+            missing = sorted(processor.get_feature_name_set().difference(instance_dict.keys()))
+            raise HTTPException(status_code=400, detail=f"Instance is missing features: {missing}")
+        return OrderedDict(zip(processor.get_ordered_feature_names(), values))
     
     @staticmethod
     def process_instance_from_request(instance_dict: Dict[str, Any]) -> OrderedDict[str, Any]:
@@ -123,8 +182,7 @@ class InstanceProcessor:
         OrderedDict[str, Any]
             Instance features in correct order for model processing.
         """
-        ordered_names = InstanceProcessor.get_ordered_feature_names()
-        return OrderedDict((name, instance_dict[name]) for name in ordered_names)
+        return InstanceProcessor.order_instance(instance_dict)
     
     @staticmethod
     def process_provided_instance() -> OrderedDict[str, Any]:
@@ -144,8 +202,6 @@ class InstanceProcessor:
         if webapp_state.provided_instance is None:
             raise ValueError("No provided instance available")
         
-        ordered_names = InstanceProcessor.get_ordered_feature_names()
-        
         if hasattr(webapp_state.provided_instance, 'to_dict'):
             instance_dict = webapp_state.provided_instance.to_dict()
         elif isinstance(webapp_state.provided_instance, dict):
@@ -153,7 +209,7 @@ class InstanceProcessor:
         else:
             instance_dict = dict(webapp_state.provided_instance)
         
-        return OrderedDict((name, instance_dict[name]) for name in ordered_names)
+        return InstanceProcessor.order_instance(instance_dict)
     
     @staticmethod
     def process_instance(request: InstanceRequest) -> Tuple[OrderedDict[str, Any], bool]:
@@ -199,15 +255,28 @@ class InstanceProcessor:
         Dict[str, float]
             Encoded instance with feature names mapped to encoded values.
         """
-        instance_array = np.array([[instance_dict[name] for name in instance_dict.keys()]])
+        instance_array = np.array([list(instance_dict.values())])
         encoded_instance = webapp_state.encoder.encode(instance_array)[0]
         
-        encoded_instance_dict = {}
-        for i, feature_name in enumerate(webapp_state.encoded_feature_names or []):
-            if i < len(encoded_instance):
-                encoded_instance_dict[feature_name] = float(encoded_instance[i])
+        return InstanceProcessor.encoded_instance_to_dict(encoded_instance)
+    
+    @staticmethod
+    def encoded_instance_to_dict(encoded_instance: np.ndarray) -> Dict[str, float]:
+        """
+        Map an already encoded instance to encoded feature names.
         
-        return encoded_instance_dict
+        Parameters
+        ----------
+        encoded_instance : np.ndarray
+            Instance in the encoded feature space.
+            
+        Returns
+        -------
+        Dict[str, float]
+            Encoded instance with feature names mapped to encoded values.
+        """
+        values = np.asarray(encoded_instance, dtype=float).ravel().tolist()
+        return dict(zip(webapp_state.encoded_feature_names or [], values))
 
 
 class VisualizationGenerator:
@@ -232,9 +301,26 @@ class VisualizationGenerator:
         -------
         List[Dict[str, Any]]
             Tree structure data for frontend visualization.
+            
+        Notes
+        -----
+        The result only depends on its inputs, so it is kept until another
+        surrogate or feature-name list is passed in or the target names
+        change. Visualization-only updates then skip the tree traversal.
+        The cached structure is shared and must not be modified.
         """
+        target_key = tuple(target_names)
+        if (_tree_data_cache["surrogate"] is surrogate
+                and _tree_data_cache["feature_names"] is feature_names
+                and _tree_data_cache["target_names"] == target_key):
+            return _tree_data_cache["data"]
+        
         tree_structure = extract_tree_structure(surrogate, feature_names, target_names)
-        return generate_decision_tree_visualization_data_raw(tree_structure)
+        tree_data = generate_decision_tree_visualization_data_raw(tree_structure)
+        _tree_data_cache.update(
+            surrogate=surrogate, feature_names=feature_names, target_names=target_key, data=tree_data
+        )
+        return tree_data
     
     @staticmethod
     def generate_scatter_plot_data(request: Union[InstanceRequest, VisualizationRequest], 
@@ -264,19 +350,51 @@ class VisualizationGenerator:
         Returns
         -------
         Dict[str, Any]
-            Scatter plot visualization data including transformed coordinates.
+            Scatter plot visualization data including transformed coordinates,
+            with the reduction method actually applied under ``methodUsed``.
+            
+        Notes
+        -----
+        t-SNE and MDS are quadratic in the number of points. When more than
+        ``quadratic_reduction_max_points`` points are projected they are
+        replaced by UMAP, with UMAP's stored parameters, unless the request
+        sets ``forceReductionMethod``.
+        
+        The last ``scatter_cache_size`` results are kept per combination of
+        input arrays, surrogate and visualization settings, so re-requesting
+        a method or step already shown for this neighborhood skips the
+        embedding. The cache is cleared when the neighborhood or surrogate
+        is replaced.
         """
         # Store all method parameters in webapp_state 
         webapp_state.update_dimensionality_reduction_parameters(request.allMethodParameters)
 
+        inputs = (X, y, X_original, y_original, surrogate)
+        key = (
+            request.dimensionalityReductionMethod, request.scatterPlotStep,
+            repr(sorted(request.dimensionalityReductionParameters.items())),
+            request.forceReductionMethod, tuple(class_names),
+            repr(sorted(webapp_state.dimensionality_reduction_parameters.items())),
+            tuple(id(obj) for obj in inputs)
+        )
+        cached = _scatter_cache.get(key)
+        if cached is not None and all(a is b for a, b in zip(cached[0], inputs)):
+            _scatter_cache.move_to_end(key)
+            return dict(cached[1])
         
         method = request.dimensionalityReductionMethod
-        parameters = {
-            **webapp_state.get_dimensionality_reduction_parameters(method), 
-            **request.dimensionalityReductionParameters
-        }
+        n_points = len(X) + (len(X_original) if X_original is not None else 0)
+        if (method.lower() in ("tsne", "t-sne", "mds") and not request.forceReductionMethod 
+                and n_points > quadratic_reduction_max_points):
+            method = "umap"
+            parameters = webapp_state.get_dimensionality_reduction_parameters(method)
+        else:
+            parameters = {
+                **webapp_state.get_dimensionality_reduction_parameters(method), 
+                **request.dimensionalityReductionParameters
+            }
         
-        return create_scatter_plot_data_raw(
+        scatter_data = create_scatter_plot_data_raw(
             X=X,
             y=y,
             pretrained_tree=surrogate,
@@ -288,6 +406,12 @@ class VisualizationGenerator:
             X_original=X_original,
             y_original=y_original
         )
+        scatter_data["methodUsed"] = method
+        
+        _scatter_cache[key] = (inputs, scatter_data)
+        while len(_scatter_cache) > scatter_cache_size:
+            _scatter_cache.popitem(last=False)
+        return dict(scatter_data)
 
 
 class DataProcessor:
@@ -318,13 +442,15 @@ class DataProcessor:
         Dict[str, Any]
             Scatter plot data including both original and neighborhood samples.
         """
-        X_encoded = webapp_state.encoder.encode(webapp_state.X)
+        X_encoded = webapp_state.get_encoded_X()
         
         scatter_data = VisualizationGenerator.generate_scatter_plot_data(
             request, X, y, surrogate, class_names, X_encoded, webapp_state.y
         )
         
-        DataProcessor._add_encoded_data_to_output(scatter_data, X_encoded, X)
+        DataProcessor._add_encoded_data_to_output(
+            scatter_data, X_encoded, X, columnar=request.columnarOriginalData
+        )
         return scatter_data
     
     @staticmethod
@@ -352,18 +478,25 @@ class DataProcessor:
         Dict[str, Any]
             Scatter plot data with neighborhood samples only.
         """
-        webapp_state.target_names = list(np.unique(y))
+        if y is webapp_state.neighb_predictions and webapp_state.neighb_classes is not None:
+            # Never mutated, so the cached list is shared rather than copied
+            webapp_state.target_names = webapp_state.neighb_classes
+        else:
+            webapp_state.target_names = StateManager.sorted_classes(y)
         
         scatter_data = VisualizationGenerator.generate_scatter_plot_data(
             request, X, y, surrogate, class_names
         )
         
-        DataProcessor._add_encoded_data_to_output(scatter_data, None, X)
+        DataProcessor._add_encoded_data_to_output(
+            scatter_data, None, X, columnar=request.columnarOriginalData
+        )
         return scatter_data
     
     @staticmethod
     def _add_encoded_data_to_output(scatter_data: Dict[str, Any], X_encoded: np.ndarray, 
-                                  X_neighborhood: np.ndarray) -> None:
+                                  X_neighborhood: np.ndarray,
+                                  columnar: bool = False) -> None:
         """
         Add encoded data arrays to scatter plot output.
         
@@ -375,24 +508,124 @@ class DataProcessor:
             Original training data (encoded).
         X_neighborhood : np.ndarray
             Neighborhood data (already encoded).
+        columnar : bool, default=False
+            Whether to store 'originalData' as ``{feature: [values...]}``
+            rather than as a list of per-point dictionaries.
             
         Notes
         -----
         Modifies scatter_data dictionary in-place by adding 'originalData' key.
+        The columnar layout names every feature once instead of once per
+        point, which shrinks the payload and skips building a dictionary
+        per row.
         """
+        if columnar:
+            blocks = [rows for rows in (X_encoded, X_neighborhood) if rows is not None]
+            columns = [DataProcessor._convert_rows_to_columns(rows) for rows in blocks]
+            scatter_data['originalData'] = {
+                name: [value for block in columns for value in block.get(name, ())]
+                for name in webapp_state.encoded_feature_names
+                if any(name in block for block in columns)
+            }
+            return
+        
         data_list = []
         
         if X_encoded is not None:
-            for row in X_encoded:
-                data_list.append(DataProcessor._convert_row_to_dict(row))
+            data_list.extend(DataProcessor._convert_rows_to_dicts(X_encoded))
         
-        for row in X_neighborhood:
-            data_list.append(DataProcessor._convert_row_to_dict(row))
+        data_list.extend(DataProcessor._neighborhood_records(X_neighborhood))
         
         scatter_data['originalData'] = data_list
     
     @staticmethod
-    def _convert_row_to_dict(row: np.ndarray) -> Dict[str, Union[int, float, Any]]:
+    def _neighborhood_records(X_neighborhood: np.ndarray) -> List[Dict[str, Union[int, float, Any]]]:
+        """
+        Convert the neighborhood to records once and reuse them.
+        
+        Parameters
+        ----------
+        X_neighborhood : np.ndarray
+            Neighborhood data (already encoded).
+            
+        Returns
+        -------
+        List[Dict[str, Union[int, float, Any]]]
+            ``_convert_rows_to_dicts(X_neighborhood)``, shared between calls
+            and therefore not to be modified.
+            
+        Notes
+        -----
+        The neighborhood only changes on ``/explain``, so visualization
+        updates reuse the records built from the same matrix and feature
+        names instead of converting every row again.
+        """
+        feature_names = webapp_state.encoded_feature_names
+        if (_neighborhood_records["rows"] is not X_neighborhood
+                or _neighborhood_records["feature_names"] is not feature_names):
+            _neighborhood_records.update(
+                rows=X_neighborhood, feature_names=feature_names,
+                records=DataProcessor._convert_rows_to_dicts(X_neighborhood)
+            )
+        return _neighborhood_records["records"]
+    
+    @staticmethod
+    def _convert_rows_to_dicts(rows: np.ndarray) -> List[Dict[str, Union[int, float, Any]]]:
+        """
+        Convert every row of a matrix to a dictionary with feature names.
+        
+        Parameters
+        ----------
+        rows : np.ndarray
+            Feature matrix with shape (n_samples, n_features).
+            
+        Returns
+        -------
+        List[Dict[str, Union[int, float, Any]]]
+            One ``_convert_row_to_dict`` result per row.
+            
+        Notes
+        -----
+        Numeric matrices are turned into Python scalars by a single
+        ``tolist`` call and zipped with the feature names, instead of
+        type-checking every cell in the interpreter. Other matrices fall back
+        to ``_convert_row_to_dict``, with the feature names looked up once
+        rather than once per row.
+        """
+        rows = np.asarray(rows)
+        names = webapp_state.encoded_feature_names
+        if rows.ndim != 2 or rows.dtype == object:
+            return [DataProcessor._convert_row_to_dict(row, names) for row in rows]
+        
+        return [dict(zip(names, row)) for row in rows.tolist()]
+    
+    @staticmethod
+    def _convert_rows_to_columns(rows: np.ndarray) -> Dict[str, List[Union[int, float, Any]]]:
+        """
+        Convert a matrix to one list of values per encoded feature name.
+        
+        Parameters
+        ----------
+        rows : np.ndarray
+            Feature matrix with shape (n_samples, n_features).
+            
+        Returns
+        -------
+        Dict[str, List[Union[int, float, Any]]]
+            Column values mapped to encoded feature names.
+        """
+        rows = np.asarray(rows)
+        if rows.ndim != 2 or rows.dtype == object:
+            records = DataProcessor._convert_rows_to_dicts(rows)
+            names = [name for name in webapp_state.encoded_feature_names
+                     if records and name in records[0]]
+            return {name: [record[name] for record in records] for name in names}
+        
+        return dict(zip(webapp_state.encoded_feature_names, rows.T.tolist()))
+    
+    @staticmethod
+    def _convert_row_to_dict(row: np.ndarray, 
+                             feature_names: Optional[List[str]] = None) -> Dict[str, Union[int, float, Any]]:
         """
         Convert numpy array row to dictionary with feature names.
         
@@ -400,22 +633,25 @@ class DataProcessor:
         ----------
         row : np.ndarray
             Single row of feature data.
+        feature_names : List[str], optional
+            Encoded feature names; read from webapp state when omitted.
             
         Returns
         -------
         Dict[str, Union[int, float, Any]]
             Feature values mapped to encoded feature names.
         """
+        if feature_names is None:
+            feature_names = webapp_state.encoded_feature_names
+        
         data_dict = {}
-        for j, feature_name in enumerate(webapp_state.encoded_feature_names):
-            if j < len(row):
-                value = row[j]
-                if isinstance(value, np.integer):
-                    data_dict[feature_name] = int(value)
-                elif isinstance(value, np.floating):
-                    data_dict[feature_name] = float(value)
-                else:
-                    data_dict[feature_name] = value
+        for feature_name, value in zip(feature_names, row):
+            if isinstance(value, np.integer):
+                data_dict[feature_name] = int(value)
+            elif isinstance(value, np.floating):
+                data_dict[feature_name] = float(value)
+            else:
+                data_dict[feature_name] = value
         return data_dict
 
 
@@ -446,7 +682,29 @@ class StateManager:
         webapp_state.neighb_encoded_predictions = encoded_predictions
         webapp_state.decoded_neighborhood = decoded_neighborhood
         webapp_state.neighb_predictions = predictions
+        webapp_state.neighb_classes = StateManager.sorted_classes(predictions)
         webapp_state.encoded_feature_names = encoded_feature_names
+        webapp_state.classes_colors = {}
+        _scatter_cache.clear()
+        _last_update.update(request=None, inputs=None, response=None)
+    
+    @staticmethod
+    def sorted_classes(y: np.ndarray) -> List[Any]:
+        """
+        List the distinct labels in ``y`` in sorted order.
+        
+        Parameters
+        ----------
+        y : np.ndarray
+            Predicted labels.
+            
+        Returns
+        -------
+        List[Any]
+            Sorted distinct labels as Python scalars.
+        """
+        # Hash-based distinct values, then sort only the handful of classes
+        return sorted(pd.unique(np.asarray(y)).tolist())
     
     @staticmethod
     def update_surrogate_model(surrogate: Any) -> None:
@@ -459,6 +717,9 @@ class StateManager:
             Trained surrogate model for local explanations.
         """
         webapp_state.surrogate = surrogate
+        _tree_data_cache.update(surrogate=None, feature_names=None, target_names=None, data=None)
+        _scatter_cache.clear()
+        _last_update.update(request=None, inputs=None, response=None)
 
 
 class ResponseBuilder:
@@ -518,6 +779,54 @@ class ResponseBuilder:
         return response
 
 
+async def build_visualizations(request: Union[InstanceRequest, VisualizationRequest], X: np.ndarray,
+                               y: np.ndarray, surrogate: Any, encoded_feature_names: List[str],
+                               target_names: List[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Generate the decision tree and scatter plot data concurrently.
+    
+    Parameters
+    ----------
+    request : Union[InstanceRequest, VisualizationRequest]
+        Request with visualization parameters.
+    X : np.ndarray
+        Encoded neighborhood feature matrix.
+    y : np.ndarray
+        Neighborhood predictions.
+    surrogate : Any
+        Trained surrogate model.
+    encoded_feature_names : List[str]
+        Names of the encoded features.
+    target_names : List[str]
+        Class label names.
+        
+    Returns
+    -------
+    Tuple[List[Dict[str, Any]], Dict[str, Any]]
+        Decision tree visualization data and scatter plot data.
+        
+    Notes
+    -----
+    Both only read the surrogate and the neighborhood, so they run in worker
+    threads side by side instead of one after the other on the event loop.
+    The dimensionality reduction dominates and releases the GIL for most of
+    its work, so the request takes roughly as long as the slower of the two.
+    """
+    if request.includeOriginalDataset:
+        prepare_scatter_data = DataProcessor.prepare_scatter_data_with_original
+    else:
+        prepare_scatter_data = DataProcessor.prepare_scatter_data_neighborhood_only
+    
+    tree_data, scatter_data = await asyncio.gather(
+        asyncio.to_thread(
+            VisualizationGenerator.generate_decision_tree_data,
+            surrogate, encoded_feature_names, target_names
+        ),
+        asyncio.to_thread(prepare_scatter_data, request, X, y, surrogate, target_names),
+    )
+    return tree_data, scatter_data
+
+
 @router.post("/update-visualization")
 async def update_visualization(request: VisualizationRequest) -> Dict[str, Any]:
     """
@@ -537,27 +846,31 @@ async def update_visualization(request: VisualizationRequest) -> Dict[str, Any]:
     -----
     Uses existing neighborhood and surrogate model from webapp state.
     Efficient for adjusting visualization without recomputing explanations.
-    """
-    tree_data = VisualizationGenerator.generate_decision_tree_data(
-        webapp_state.surrogate,
-        webapp_state.encoded_feature_names,
-        webapp_state.target_names
-    )
     
-    if request.includeOriginalDataset:
-        scatter_data = DataProcessor.prepare_scatter_data_with_original(
-            request, webapp_state.neighborhood, webapp_state.neighb_predictions,
-            webapp_state.surrogate, webapp_state.target_names
+    A request equal to the previous one, against the same neighborhood,
+    surrogate and dataset, gets the previous response back without
+    rebuilding or re-converting the payload.
+    """
+    async with webapp_state_lock:
+        inputs = (
+            webapp_state.neighborhood, webapp_state.neighb_predictions, webapp_state.surrogate,
+            webapp_state.encoded_feature_names, webapp_state.X, webapp_state.y
         )
-    else:
-        scatter_data = DataProcessor.prepare_scatter_data_neighborhood_only(
+        if (_last_update["response"] is not None and _last_update["request"] == request
+                and all(a is b for a, b in zip(_last_update["inputs"], inputs))):
+            return _last_update["response"]
+        
+        tree_data, scatter_data = await build_visualizations(
             request, webapp_state.neighborhood, webapp_state.neighb_predictions,
-            webapp_state.surrogate, webapp_state.target_names
+            webapp_state.surrogate, webapp_state.encoded_feature_names, webapp_state.target_names
         )
+        
+        response = safe_json_response(ResponseBuilder.build_success_response(
+            "Visualization updated", tree_data, scatter_data
+        ))
+        _last_update.update(request=request, inputs=inputs, response=response)
     
-    return safe_json_response(ResponseBuilder.build_success_response(
-        "Visualization updated", tree_data, scatter_data
-    ))
+    return response
 
 
 @router.post("/explain")
@@ -580,27 +893,50 @@ async def explain_instance(request: InstanceRequest) -> Dict[str, Any]:
     -----
     Automatically detects whether to use instance from request or from webapp state.
     Initializes explanation components if needed, generates neighborhood samples,
-    trains surrogate model, and produces visualizations.
+    trains surrogate model, and produces visualizations. Neighborhood generation,
+    surrogate training and the visualizations run in worker threads, so the event
+    loop keeps serving other requests; explanations and model training are
+    serialized because they all write to webapp state.
     """
-    # Always reinitialize surrogate and encoder to ensure compatibility with current dataset
-    from ...surrogate import DecisionTreeSurrogate
-    from ...encoder_decoder import ColumnTransformerEnc
-    
+    async with webapp_state_lock:
+        return await _explain_instance(request)
+
+
+async def _explain_instance(request: InstanceRequest) -> Dict[str, Any]:
+    """Run the explanation pipeline for ``explain_instance``."""
+    # Always reinitialize the surrogate; the encoder is rebuilt only when the
+    # dataset descriptor changed, since fitting it is pure redundant work otherwise
     webapp_state.surrogate = DecisionTreeSurrogate()
-    webapp_state.encoder = ColumnTransformerEnc(webapp_state.descriptor)
+    if not (isinstance(webapp_state.encoder, ColumnTransformerEnc)
+            and webapp_state.encoder.dataset_descriptor is webapp_state.descriptor):
+        webapp_state.encoder = ColumnTransformerEnc(webapp_state.descriptor)
 
     # Process instance from either request or webapp state
     instance_dict = InstanceProcessor.process_instance(request)
 
+    cached_explanation = None
+    if persist_explanations:
+        explanation_cache = ExplanationCache()
+        cache_path = await asyncio.to_thread(
+            explanation_cache.get_cache_path, webapp_state.dataset_name, webapp_state.bbox,
+            instance_dict, request.keepDuplicates, request.neighbourhood_size
+        )
+        cached_explanation = await asyncio.to_thread(explanation_cache.load, cache_path)
+
+    if cached_explanation is not None:
+        neighbourhood_result, webapp_state.surrogate = cached_explanation
+    else:
+        neighbourhood_result = await asyncio.to_thread(
+            create_neighbourhood_with_lore,
+            instance=instance_dict,
+            bbox=webapp_state.bbox,
+            dataset=webapp_state.dataset,
+            keepDuplicates=request.keepDuplicates,
+            neighbourhood_size=request.neighbourhood_size,
+        )
     (neighborhood, encoded_predictions, 
     decoded_neighborhood, predictions,
-     encoded_feature_names) = create_neighbourhood_with_lore(
-        instance=instance_dict,
-        bbox=webapp_state.bbox,
-        dataset=webapp_state.dataset,
-        keepDuplicates=request.keepDuplicates,
-        neighbourhood_size=request.neighbourhood_size,
-    )
+     encoded_feature_names) = neighbourhood_result
     
     StateManager.update_neighborhood_data(
         neighborhood, encoded_predictions, 
@@ -608,24 +944,23 @@ async def explain_instance(request: InstanceRequest) -> Dict[str, Any]:
         encoded_feature_names
     )
     
-    encoded_instance = InstanceProcessor.encode_instance(instance_dict)
+    # The neighborhood always ends with the encoded instance, so reuse it
+    # instead of encoding the raw instance a second time
+    encoded_instance = InstanceProcessor.encoded_instance_to_dict(neighborhood[-1])
     
-    train_surrogate(neighborhood, webapp_state.neighb_encoded_predictions)
+    if cached_explanation is None:
+        await asyncio.to_thread(train_surrogate, neighborhood, webapp_state.neighb_encoded_predictions)
+        if persist_explanations:
+            await asyncio.to_thread(
+                explanation_cache.save, cache_path, neighbourhood_result, webapp_state.surrogate
+            )
     StateManager.update_surrogate_model(webapp_state.surrogate)
         
-    tree_data = VisualizationGenerator.generate_decision_tree_data(
+    tree_data, scatter_data = await build_visualizations(
+        request, neighborhood, webapp_state.neighb_predictions,
         webapp_state.surrogate, encoded_feature_names, webapp_state.target_names
     )
     
-    if request.includeOriginalDataset:
-        scatter_data = DataProcessor.prepare_scatter_data_with_original(
-            request, neighborhood, webapp_state.neighb_predictions, webapp_state.surrogate, webapp_state.target_names
-        )
-    else:
-        scatter_data = DataProcessor.prepare_scatter_data_neighborhood_only(
-            request, neighborhood, webapp_state.neighb_predictions, webapp_state.surrogate, webapp_state.target_names
-        )
-    
     return safe_json_response(ResponseBuilder.build_success_response(
         "Instance explained", tree_data, scatter_data, encoded_instance
     ))
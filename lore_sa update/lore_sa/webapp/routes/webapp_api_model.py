@@ -1,15 +1,26 @@
-from typing import Dict, Any
-from fastapi import APIRouter
-from pydantic import BaseModel
-from fastapi.responses import JSONResponse
+from typing import Dict, Any, List, Optional, Union
+import json
+import asyncio
+import hashlib
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, ConfigDict
+from fastapi.responses import JSONResponse, Response
 
-from ..webapp_model import get_available_classifiers, train_model_with_lore
+from ..webapp_model import get_available_classifiers, train_model_with_lore, train_models_with_lore
 from ..webapp_datasets import DATASETS
-from .webapp_api_state import webapp_state
+from .webapp_api_state import webapp_state, webapp_state_lock
 from .webapp_api_utils import safe_json_response
 
 router = APIRouter(prefix="/api")
 
+# Serialized /get-classifiers payload and its ETag; the classifier defaults never change
+_classifiers_payload: Optional[bytes] = None
+_classifiers_etag: Optional[str] = None
+
+# Hyperparameter values accepted from the client; every default in
+# CLASSIFIERS is one of these scalar types
+ClassifierParameter = Union[bool, int, float, str, None]
+
 
 class TrainingRequest(BaseModel):
     """
@@ -21,29 +32,131 @@ class TrainingRequest(BaseModel):
         Name of the dataset to use for training.
     classifier : str
         Type of classifier to train.
-    parameters : Dict[str, Any]
+    parameters : Dict[str, ClassifierParameter]
         Hyperparameters for the classifier.
     """
+    model_config = ConfigDict(extra="forbid")
+    
     dataset_name: str
     classifier: str
-    parameters: Dict[str, Any]
+    parameters: Dict[str, ClassifierParameter]
+
+
+class ClassifierSpec(BaseModel):
+    """
+    One classifier to train in a multi-training request.
+    
+    Attributes
+    ----------
+    classifier : str
+        Type of classifier to train.
+    parameters : Dict[str, ClassifierParameter]
+        Hyperparameters for the classifier.
+    """
+    model_config = ConfigDict(extra="forbid")
+    
+    classifier: str
+    parameters: Dict[str, ClassifierParameter] = {}
+
+
+class MultiTrainingRequest(BaseModel):
+    """
+    Request model for training several classifiers on one dataset.
+    
+    Attributes
+    ----------
+    dataset_name : str
+        Name of the dataset to use for training.
+    classifiers : List[ClassifierSpec]
+        Classifiers to train. The first one becomes the active model.
+    """
+    model_config = ConfigDict(extra="forbid")
+    
+    dataset_name: str
+    classifiers: List[ClassifierSpec]
+
+
+class TrainResponse(BaseModel):
+    """
+    Response model for the training endpoints.
+    
+    Attributes
+    ----------
+    status : str
+        Outcome of the training request.
+    message : str
+        Human readable summary.
+    descriptor : Dict[str, Any]
+        Feature descriptor of the dataset the active model was trained on.
+    """
+    status: str
+    message: str
+    descriptor: Dict[str, Any]
+
+
+def _install_model(bbox: Any, dataset: Any, feature_names: List[str]) -> None:
+    """
+    Make a trained model the active one in webapp_state.
+    
+    Parameters
+    ----------
+    bbox : Any
+        Trained model wrapper.
+    dataset : Any
+        Dataset object the model was trained on.
+    feature_names : List[str]
+        Feature names of the dataset.
+        
+    Notes
+    -----
+    Clears the explanation components of the previous model and assigns
+    the new artifacts without awaiting in between, so other requests never
+    observe a model paired with another model's dataset or explanation.
+    """
+    webapp_state.reset_explanation_components()
+    webapp_state.bbox = bbox
+    webapp_state.dataset = dataset
+    webapp_state.feature_names = feature_names
+    webapp_state.descriptor = dataset.descriptor
 
 
 @router.get("/get-classifiers")
-async def get_classifiers() -> Dict[str, Any]:
+async def get_classifiers(request: Request) -> Dict[str, Any]:
     """
     Retrieve available machine learning classifiers.
     
+    Parameters
+    ----------
+    request : Request
+        Incoming request, checked for an ``If-None-Match`` header.
+    
     Returns
     -------
     Dict[str, Any]
         Dictionary containing available classifiers and their configurations.
+        
+    Notes
+    -----
+    The defaults are read-only, so the JSON body is serialized on the first
+    request and the same bytes are sent afterwards. The body carries an
+    ETag; clients revalidating with it get an empty 304 response instead.
     """
-    return safe_json_response({"classifiers": get_available_classifiers()})
+    global _classifiers_payload, _classifiers_etag
+    if _classifiers_payload is None:
+        classifiers = {name: dict(params) for name, params in get_available_classifiers().items()}
+        _classifiers_payload = json.dumps(
+            safe_json_response({"classifiers": classifiers}), separators=(",", ":")
+        ).encode()
+        _classifiers_etag = f'"{hashlib.blake2b(_classifiers_payload, digest_size=8).hexdigest()}"'
+    
+    headers = {"ETag": _classifiers_etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == _classifiers_etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=_classifiers_payload, media_type="application/json", headers=headers)
 
 
-@router.post("/train-model")
-async def train_model(request: TrainingRequest) -> Dict[str, Any]:
+@router.post("/train-model", response_model=TrainResponse)
+async def train_model(request: TrainingRequest) -> TrainResponse:
     """
     Train a machine learning model with specified parameters.
     
@@ -54,22 +167,75 @@ async def train_model(request: TrainingRequest) -> Dict[str, Any]:
         
     Returns
     -------
-    Dict[str, Any]
+    TrainResponse
         Training status and model descriptor information.
         
     Notes
     -----
-    Updates global webapp_state with trained model artifacts.
+    Updates global webapp_state with trained model artifacts. Training (or
+    loading the cached model) runs in a worker thread, so the event loop
+    keeps serving other requests while the classifier is fitted. It holds
+    ``webapp_state_lock`` so no explanation runs against a half-replaced
+    model, and the model artifacts are swapped in together once training
+    is done. The reply describes the dataset this request installed, even
+    if another training request has replaced it since. Declaring
+    ``TrainResponse`` lets FastAPI serialize the reply to JSON in
+    pydantic's core instead of walking it with jsonable_encoder.
     """
-    webapp_state.reset_explanation_components()
+    async with webapp_state_lock:
+        bbox, dataset, feature_names = await asyncio.to_thread(
+            train_model_with_lore, request.dataset_name, request.classifier, request.parameters
+        )
+        _install_model(bbox, dataset, feature_names)
 
-    webapp_state.bbox, webapp_state.dataset, webapp_state.feature_names = train_model_with_lore(
-        request.dataset_name, request.classifier, request.parameters
+    return TrainResponse(
+        status="success",
+        message="Model trained successfully",
+        descriptor=safe_json_response(dataset.descriptor),
     )
-    webapp_state.descriptor = webapp_state.dataset.descriptor
 
-    return safe_json_response({
-        "status": "success",
-        "message": "Model trained successfully",
-        "descriptor": webapp_state.descriptor,
-    })
+
+@router.post("/train-models", response_model=TrainResponse)
+async def train_models(request: MultiTrainingRequest) -> TrainResponse:
+    """
+    Train several machine learning models concurrently.
+    
+    Parameters
+    ----------
+    request : MultiTrainingRequest
+        Dataset and classifier specifications to train.
+        
+    Returns
+    -------
+    TrainResponse
+        Training status and model descriptor information of the active model.
+        
+    Raises
+    ------
+    HTTPException
+        400 if no classifiers are requested.
+        
+    Notes
+    -----
+    All classifiers are fitted in parallel worker processes and cached; the
+    first one is then loaded from the cache into the global webapp_state.
+    The request waits for them in a worker thread, off the event loop.
+    """
+    specs = [(spec.classifier, spec.parameters) for spec in request.classifiers]
+    if not specs:
+        raise HTTPException(status_code=400, detail="No classifiers requested")
+    
+    async with webapp_state_lock:
+        await asyncio.to_thread(train_models_with_lore, request.dataset_name, specs)
+        
+        classifier_name, parameters = specs[0]
+        bbox, dataset, feature_names = await asyncio.to_thread(
+            train_model_with_lore, request.dataset_name, classifier_name, parameters
+        )
+        _install_model(bbox, dataset, feature_names)
+
+    return TrainResponse(
+        status="success",
+        message=f"{len(specs)} models trained successfully",
+        descriptor=safe_json_response(dataset.descriptor),
+    )
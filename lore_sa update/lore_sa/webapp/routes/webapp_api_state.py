@@ -1,4 +1,5 @@
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, Tuple
+import asyncio
 import numpy as np
 import pandas as pd
 
@@ -38,6 +39,8 @@ class WebappState:
         Human-readable neighborhood samples.
     neighb_predictions : np.ndarray
         Raw predictions for neighborhood samples.
+    neighb_classes : List[Any]
+        Sorted distinct values of ``neighb_predictions``.
     dt_surrogate : Any
         Decision tree surrogate model for explanations.
     encoder : Any
@@ -50,8 +53,31 @@ class WebappState:
         User-provided instance for explanation.
     dimensionality_reduction_parameters : Dict[str, Dict[str, Any]]
         Parameters for all dimensionality reduction methods.
+    classes_colors : Dict[str, List[str]]
+        Class colors computed from the current neighborhood, by reduction
+        method. Cleared whenever the neighborhood or the reduction
+        parameters change.
+    X_encoded : np.ndarray
+        Training features encoded by ``encoder``, reused by the scatter
+        plot while both ``X`` and ``encoder`` are the same objects.
+        
+    Notes
+    -----
+    Attributes live in ``__slots__`` rather than an instance ``__dict__``:
+    every request reads this object many times, and slot descriptors skip
+    the dictionary lookup. New state must be added to ``__slots__``.
     """
     
+    __slots__ = (
+        'bbox', 'descriptor', 'X', 'y',
+        'dataset', 'dataset_name', 'feature_names', 'target_names', 'encoded_feature_names',
+        'neighborhood', 'neighb_encoded_predictions', 'decoded_neighborhood',
+        'neighb_predictions', 'neighb_classes', 'dt_surrogate',
+        'encoder', 'generator', 'surrogate', 'provided_instance',
+        'dimensionality_reduction_parameters', 'classes_colors',
+        'X_encoded', '_X_encoded_source',
+    )
+    
     def __init__(self) -> None:
         """Initialize webapp state with default None values."""
         self.bbox: Any= None
@@ -70,6 +96,7 @@ class WebappState:
 
         self.decoded_neighborhood: pd.DataFrame = None
         self.neighb_predictions: np.ndarray = None
+        self.neighb_classes: List[Any] = None
         self.dt_surrogate: Any = None
         
         self.encoder: Any = None
@@ -85,6 +112,31 @@ class WebappState:
             "t-SNE": {},
             "MDS": {}
         }
+        self.classes_colors: Dict[str, List[str]] = {}
+        self.X_encoded: np.ndarray = None
+        self._X_encoded_source: Tuple[Any, Any] = (None, None)
+
+    def get_encoded_X(self) -> np.ndarray:
+        """
+        Encode the training features with the current encoder, reusing the last result.
+        
+        Returns
+        -------
+        np.ndarray
+            ``encoder.encode(X)``.
+            
+        Notes
+        -----
+        The result is cached until ``X`` or ``encoder`` is replaced by
+        another object, which happens when the dataset, the model or the
+        dataset descriptor changes.
+        """
+        source = (self.X, self.encoder)
+        if self.X_encoded is None or self._X_encoded_source[0] is not source[0] \
+                or self._X_encoded_source[1] is not source[1]:
+            self.X_encoded = self.encoder.encode(self.X)
+            self._X_encoded_source = source
+        return self.X_encoded
 
     def reset(self) -> None:
         """
@@ -110,8 +162,10 @@ class WebappState:
         self.neighb_encoded_predictions = None
         self.decoded_neighborhood = None
         self.neighb_predictions = None
+        self.neighb_classes = None
         self.dt_surrogate = None
         self.encoded_feature_names = None
+        self.classes_colors = {}
         
     def reset_dataset_state(self) -> None:
         """
@@ -125,6 +179,8 @@ class WebappState:
         self.descriptor = None
         self.X = None
         self.y = None
+        self.X_encoded = None
+        self._X_encoded_source = (None, None)
         self.dataset = None
         self.dataset_name = None
         self.feature_names = None
@@ -138,11 +194,24 @@ class WebappState:
         ----------
         parameters : Dict[str, Dict[str, Any]]
             Parameters organized by method name (UMAP, PCA, t-SNE, MDS).
+
+        Notes
+        -----
+        The frontend sends every method's parameters with each request, so
+        ``classes_colors`` is only cleared when a stored value actually
+        changes.
         """
-        if parameters:
-            for method, method_params in parameters.items():
-                if method in self.dimensionality_reduction_parameters:
-                    self.dimensionality_reduction_parameters[method].update(method_params)
+        if not parameters:
+            return
+        for method, method_params in parameters.items():
+            stored_params = self.dimensionality_reduction_parameters.get(method)
+            if stored_params is None:
+                continue
+            changed = {name: value for name, value in method_params.items()
+                       if name not in stored_params or stored_params[name] != value}
+            if changed:
+                stored_params.update(changed)
+                self.classes_colors = {}
     
     def get_dimensionality_reduction_parameters(self, method: str = None) -> Dict[str, Any]:
         """
@@ -164,3 +233,7 @@ class WebappState:
 
 
 webapp_state = WebappState()
+
+# Explanations and model training run off the event loop but all write
+# webapp_state, so they take turns
+webapp_state_lock = asyncio.Lock()
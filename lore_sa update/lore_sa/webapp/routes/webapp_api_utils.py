@@ -1,5 +1,13 @@
 from typing import Any, Dict, List, Union, Set
 import numpy as np
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+except ImportError:
+    # Without orjson fall back to the standard library encoder
+    FastJSONResponse = JSONResponse
 
 
 def convert_numpy_types(obj: Any) -> Any:
@@ -11,6 +11,17 @@ import networkx as nx
 
 from .webapp_dimensionality_reduction_utils import create_dimensionality_reducer, can_generate_boundary
 
+# Lighter defaults for the interactive scatter plot, which is recomputed
+# on every explanation. User-supplied parameters always take precedence.
+interactive_reduction_defaults = {
+    'umap': {'init': 'pca', 'n_epochs': 200},
+    'tsne': {'max_iter': 500},
+}
+
+# Spacing, in mesh steps (a power of two), of the first decision boundary samples; cells whose
+# corners disagree are halved until they reach the requested step
+boundary_refinement_span = 4
+
 
 class DimensionalityReducer:
     """
@@ -21,7 +32,8 @@ class DimensionalityReducer:
     method : str, default='umap'
         Reduction method ('pca', 'tsne', 'umap', 'mds').
     parameters : dict, default=None
-        Method-specific parameters.
+        Method-specific parameters, layered over
+        ``interactive_reduction_defaults`` for the method.
     random_state : int, default=42
         Random seed for reproducible results.
         
@@ -42,7 +54,7 @@ class DimensionalityReducer:
     def __init__(self, method: str = 'umap', parameters: dict = None, random_state: int = 42) -> None:
         """Initialize dimensionality reducer with specified method and parameters."""
         self.method = method.lower()
-        self.parameters = parameters or {}
+        self.parameters = {**interactive_reduction_defaults.get(self.method, {}), **(parameters or {})}
         self.random_state = random_state
         self.scaler = StandardScaler()
         self.reducer = None
@@ -65,8 +77,14 @@ class DimensionalityReducer:
         ------
         ValueError
             If unsupported reduction method is specified.
+            
+        Notes
+        -----
+        The reduction runs on a C-contiguous float32 copy of ``X``, halving
+        the memory traffic through the neighbour search. The caller's
+        array, which also feeds the tooltip values, keeps its precision.
         """
-        X_scaled = self.scaler.fit_transform(X)
+        X_scaled = self.scaler.fit_transform(np.ascontiguousarray(X, dtype=np.float32))
         
         self.reducer = create_dimensionality_reducer(
             self.method, 
@@ -220,20 +238,19 @@ class DecisionBoundaryGenerator:
             
         Notes
         -----
-        Creates dense grid in 2D space, transforms back to original space
-        for model prediction, then generates Voronoi regions for visualization.
+        Samples the 2D space on an adaptive grid (see ``_sample_adaptive_mesh``),
+        transforms the samples back to original space for model prediction,
+        then generates Voronoi regions for visualization.
         """
         x_min, x_max = X_transformed[:, 0].min() - 1, X_transformed[:, 0].max() + 1
         y_min, y_max = X_transformed[:, 1].min() - 1, X_transformed[:, 1].max() + 1
-        xx, yy = np.meshgrid(
-            np.arange(x_min, x_max, self.step),
-            np.arange(y_min, y_max, self.step)
-        )
         
-        grid_points = np.c_[xx.ravel(), yy.ravel()]
-        grid_original = reducer.inverse_transform(grid_points)
-        grid_original = scaler.inverse_transform(grid_original)
-        Z = model.dt.predict(grid_original).reshape(xx.shape)
+        def predict(grid_points: np.ndarray) -> np.ndarray:
+            grid_original = reducer.inverse_transform(grid_points)
+            grid_original = scaler.inverse_transform(grid_original)
+            return model.dt.predict(grid_original)
+        
+        xx, yy, Z = self._sample_adaptive_mesh(x_min, x_max, y_min, y_max, predict)
         
         regions, region_classes = self._create_voronoi_regions(xx, yy, Z, class_names)
         
@@ -244,6 +261,94 @@ class DecisionBoundaryGenerator:
             "yRange": [float(y_min), float(y_max)],
         }
     
+    def _sample_adaptive_mesh(self, x_min: float, x_max: float, y_min: float, y_max: float,
+                              predict: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sample the mesh densely only where the predicted class changes.
+        
+        Parameters
+        ----------
+        x_min, x_max, y_min, y_max : float
+            Bounds of the mesh in 2D space.
+        predict : Any
+            Callable mapping an (n, 2) array of 2D points to class labels.
+            
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            X coordinates, Y coordinates and predicted labels of the sampled
+            mesh points.
+            
+        Notes
+        -----
+        The mesh is the uniform ``step`` grid, but it is first predicted only
+        every ``boundary_refinement_span`` steps. Cells whose four corners get
+        the same class are kept at that size; the others are halved and their
+        new corners predicted, down to ``step``. The two outermost rings are
+        always sampled at ``step``: Voronoi cells on the border are unbounded
+        and get dropped, and the second ring keeps the cells behind them
+        bounded. Surrogate trees split along few directions, so most of the
+        mesh is constant-class and needs far fewer predictions.
+        """
+        xs = np.arange(x_min, x_max, self.step)
+        ys = np.arange(y_min, y_max, self.step)
+        n_rows, n_cols = len(ys), len(xs)
+        xx, yy = np.meshgrid(xs, ys)
+        
+        if n_rows < 2 or n_cols < 2:
+            return xx, yy, predict(np.c_[xx.ravel(), yy.ravel()]).reshape(xx.shape)
+        
+        known = np.zeros((n_rows, n_cols), dtype=bool)
+        Z = None
+        
+        def predict_nodes(mask: np.ndarray) -> None:
+            nonlocal Z
+            mask = mask & ~known
+            if not mask.any():
+                return
+            labels = predict(np.c_[xx[mask], yy[mask]])
+            if Z is None:
+                Z = np.empty((n_rows, n_cols), dtype=labels.dtype)
+            Z[mask] = labels
+            known[mask] = True
+        
+        border = np.zeros((n_rows, n_cols), dtype=bool)
+        border[[0, 1, -2, -1], :] = True
+        border[:, [0, 1, -2, -1]] = True
+        predict_nodes(border)
+        
+        # Unit cells of the full mesh that still need refining
+        region = np.ones((n_rows - 1, n_cols - 1), dtype=bool)
+        span = max(1, int(boundary_refinement_span))
+        
+        while True:
+            rows = np.unique(np.r_[np.arange(0, n_rows, span), n_rows - 1])
+            cols = np.unique(np.r_[np.arange(0, n_cols, span), n_cols - 1])
+            
+            nodes = np.zeros((n_rows, n_cols), dtype=bool)
+            nodes[:-1, :-1] |= region
+            nodes[1:, :-1] |= region
+            nodes[:-1, 1:] |= region
+            nodes[1:, 1:] |= region
+            level_nodes = np.zeros((n_rows, n_cols), dtype=bool)
+            level_nodes[np.ix_(rows, cols)] = True
+            predict_nodes(nodes & level_nodes)
+            
+            if span == 1:
+                break
+            
+            corners = Z[np.ix_(rows, cols)]
+            split = (
+                region[np.ix_(rows[:-1], cols[:-1])]
+                & ((corners[:-1, :-1] != corners[1:, :-1])
+                   | (corners[:-1, :-1] != corners[:-1, 1:])
+                   | (corners[:-1, :-1] != corners[1:, 1:]))
+            )
+            region = np.repeat(np.repeat(split, np.diff(rows), axis=0), np.diff(cols), axis=1)
+            span //= 2
+        
+        return xx[known], yy[known], Z[known]
+    
     def generate_basic_bounds(self, X_transformed: np.ndarray) -> Dict[str, List[float]]:
         """
         Generate basic coordinate bounds without decision boundaries.
@@ -324,7 +429,7 @@ class DecisionBoundaryGenerator:
             if -1 in ridge_vertices:
                 continue
             r1, r2 = vor.point_region[p1], vor.point_region[p2]
-            if region_class_map.get(r1) == region_class_map.get(r2):
+            if r1 in region_class_map and region_class_map.get(r1) == region_class_map.get(r2):
                 G.add_edge(r1, r2)
         
         merged_regions = []
@@ -414,11 +519,24 @@ class FeatureProcessor:
         -----
         Handles NumPy type conversion for JSON serialization.
         Maps feature values to encoded feature names when available.
+        Numeric arrays are converted to Python scalars by one ``tolist``
+        call and zipped with the names row by row; only object arrays,
+        whose cells may hold NumPy scalars or arrays, are converted value
+        by value.
         """
         if feature_names is None:
             return data_array.tolist()
         
         data_array = data_array.values if hasattr(data_array, 'values') else data_array
+        
+        if isinstance(data_array, np.ndarray) and data_array.ndim == 2 and data_array.dtype != object:
+            names = list(feature_names)
+            padding = names[data_array.shape[1]:]
+            if padding:
+                missing = dict.fromkeys(padding, 0.0)
+                return [{**dict(zip(names, row)), **missing} for row in data_array.tolist()]
+            return [dict(zip(names, row)) for row in data_array.tolist()]
+        
         feature_dicts = []
         
         for row in data_array:
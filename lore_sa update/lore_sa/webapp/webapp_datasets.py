@@ -2,8 +2,10 @@ from typing import Dict, List, Tuple, Any, Union
 import numpy as np
 import pandas as pd
 import os
+import copy
 import joblib
 import logging
+from collections import OrderedDict
 from sklearn.datasets import (
     load_iris, load_wine, load_breast_cancer, load_diabetes, 
     fetch_california_housing, fetch_openml
@@ -22,6 +24,10 @@ DATASETS = {
     'california_housing_11': 'tabular',
 }
 
+dataset_memo_size = 4
+_dataset_memo: 'OrderedDict[str, Tuple[Any, List[str], List[str]]]' = OrderedDict()
+_dataset_information_memo: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
 
 class MockDataset:
     """
@@ -240,6 +246,33 @@ def get_dataset_information_german() -> Dict[str, Any]:
     }
 
 
+def _dump_atomically(value: Any, cache_file: str) -> None:
+    """
+    Write a joblib pickle so readers only ever see a complete file.
+    
+    Parameters
+    ----------
+    value : Any
+        Object to pickle.
+    cache_file : str
+        Final path of the pickle.
+        
+    Notes
+    -----
+    The pickle is written to a per-process temporary file and renamed into
+    place, so concurrent writers (such as parallel training workers loading
+    the same dataset) cannot interleave or leave a truncated file behind.
+    """
+    root, extension = os.path.splitext(cache_file)
+    temporary_path = f'{root}.{os.getpid()}.tmp{extension}'
+    try:
+        joblib.dump(value, temporary_path)
+        os.replace(temporary_path, cache_file)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+
 def load_cached_dataset_information(dataset_name: str, info_function: callable, 
                                   cache_dir: str = 'webapp cache') -> Dict[str, Any]:
     """
@@ -271,7 +304,7 @@ def load_cached_dataset_information(dataset_name: str, info_function: callable,
         logging.info(f"Loaded {dataset_name} information from webapp cache.")
     else:
         info = info_function()
-        joblib.dump(info, cache_file)
+        _dump_atomically(info, cache_file)
         logging.info(f"Cached {dataset_name} information to file.")
     
     return info
@@ -594,7 +627,7 @@ def load_cached_dataset(dataset_name: str, load_function: callable,
     
     dataset = load_function()
     
-    joblib.dump(dataset, cache_file)
+    _dump_atomically(dataset, cache_file)
     logging.info(f"Cached {dataset_name} to file.")
     
     return dataset
@@ -620,7 +653,17 @@ def get_dataset_information(dataset_name: str, cache_dir: str = 'webapp cache')
     ------
     KeyError
         If dataset_name is not recognized.
+        
+    Notes
+    -----
+    Metadata never changes for a dataset, so it is also kept in memory after
+    the first call and later calls skip the disk cache. Callers receive a
+    deep copy because they may sort or edit the returned lists.
     """
+    memo_key = (dataset_name, cache_dir)
+    if memo_key in _dataset_information_memo:
+        return copy.deepcopy(_dataset_information_memo[memo_key])
+    
     information_functions = {
         'iris': get_dataset_information_iris,
         'wine': get_dataset_information_wine,
@@ -633,7 +676,9 @@ def get_dataset_information(dataset_name: str, cache_dir: str = 'webapp cache')
         'california_housing_11': get_dataset_information_california_housing_11,
     }
     
-    return load_cached_dataset_information(dataset_name, information_functions[dataset_name], cache_dir=cache_dir)
+    info = load_cached_dataset_information(dataset_name, information_functions[dataset_name], cache_dir=cache_dir)
+    _dataset_information_memo[memo_key] = copy.deepcopy(info)
+    return info
         
 
 def load_dataset(dataset_name: str) -> Tuple[Any, List[str], List[str]]:
@@ -659,7 +704,16 @@ def load_dataset(dataset_name: str) -> Tuple[Any, List[str], List[str]]:
     -----
     Main interface for dataset loading with automatic caching.
     Supports both sklearn built-in datasets and processed OpenML datasets.
+    The ``dataset_memo_size`` most recently loaded datasets are also kept
+    in memory, so repeated requests skip unpickling the disk cache. The
+    dataset object is shared between callers and must not be modified in
+    place; the name lists are returned as fresh copies.
     """
+    if dataset_name in _dataset_memo:
+        _dataset_memo.move_to_end(dataset_name)
+        ds, feature_names, target_names = _dataset_memo[dataset_name]
+        return ds, list(feature_names), list(target_names)
+    
     loading_functions = {
         'iris': load_dataset_iris,
         'wine': load_dataset_wine,
@@ -672,6 +726,10 @@ def load_dataset(dataset_name: str) -> Tuple[Any, List[str], List[str]]:
         'california_housing_11': load_dataset_california_housing_11,
     }
     
-    result = load_cached_dataset(dataset_name, loading_functions[dataset_name])
+    ds, feature_names, target_names = load_cached_dataset(dataset_name, loading_functions[dataset_name])
+    
+    _dataset_memo[dataset_name] = (ds, list(feature_names), list(target_names))
+    while len(_dataset_memo) > dataset_memo_size:
+        _dataset_memo.popitem(last=False)
     
-    return result
+    return ds, feature_names, target_names
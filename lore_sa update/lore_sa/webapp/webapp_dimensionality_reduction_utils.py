@@ -3,9 +3,119 @@ import numpy as np
 import logging
 import umap
 
+try:
+    from openTSNE import TSNE as OpenTSNE
+    OPENTSNE_AVAILABLE = True
+except ImportError:
+    OPENTSNE_AVAILABLE = False
+
+try:
+    import cupy
+    from cuml import PCA as cuPCA, TSNE as cuTSNE, UMAP as cuUMAP
+    CUML_AVAILABLE = True
+except ImportError:
+    CUML_AVAILABLE = False
+
 # Configure logging for numba (used by UMAP)
 logging.getLogger('numba').setLevel(logging.WARNING)
 
+_gpu_available = None
+_umap_warmed_up = False
+
+
+def gpu_available() -> bool:
+    """
+    Report whether reducers can run on a CUDA device through cuML.
+    
+    Returns
+    -------
+    bool
+        True if cuML is installed and at least one CUDA device is visible.
+        
+    Notes
+    -----
+    The device query runs once per process and the answer is reused.
+    """
+    global _gpu_available
+    if _gpu_available is None:
+        _gpu_available = False
+        if CUML_AVAILABLE:
+            try:
+                _gpu_available = cupy.cuda.runtime.getDeviceCount() > 0
+            except Exception:
+                _gpu_available = False
+    return _gpu_available
+
+
+class _CumlReducer:
+    """
+    Adapter running a cuML estimator on host arrays.
+    
+    Parameters
+    ----------
+    estimator : Any
+        cuML reducer exposing ``fit_transform``.
+    """
+    
+    def __init__(self, estimator: Any) -> None:
+        """Store the wrapped cuML estimator."""
+        self.estimator = estimator
+    
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Move the data to the device, embed it and copy the result back.
+        
+        Parameters
+        ----------
+        X : np.ndarray
+            Data to embed, shape (n_samples, n_features).
+            
+        Returns
+        -------
+        np.ndarray
+            Embedding with shape (n_samples, n_components), on the host.
+        """
+        embedding = self.estimator.fit_transform(cupy.asarray(X, dtype=np.float32))
+        return cupy.asnumpy(embedding).astype(np.float64, copy=False)
+    
+    def __getattr__(self, name: str) -> Any:
+        """Expose fitted attributes such as ``components_`` as host arrays."""
+        if name == 'estimator':
+            raise AttributeError(name)
+        value = getattr(self.estimator, name)
+        return cupy.asnumpy(value) if isinstance(value, cupy.ndarray) else value
+
+
+class _OpenTSNEReducer:
+    """
+    Adapter exposing openTSNE's interpolation-based t-SNE as ``fit_transform``.
+    
+    Parameters
+    ----------
+    **params : Any
+        Keyword arguments forwarded to ``openTSNE.TSNE``.
+    """
+    
+    def __init__(self, **params: Any) -> None:
+        """Store the openTSNE configuration."""
+        self.params = params
+    
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Embed the data with openTSNE.
+        
+        Parameters
+        ----------
+        X : np.ndarray
+            Data to embed, shape (n_samples, n_features).
+            
+        Returns
+        -------
+        np.ndarray
+            Embedding with shape (n_samples, n_components).
+        """
+        return np.asarray(OpenTSNE(**self.params).fit(np.asarray(X, dtype=np.float64)))
+
 
 def create_dimensionality_reducer(method: str, n_components: int, parameters: Dict[str, Any] = None, 
                                  random_state: int = 42, X_scaled: np.ndarray = None):
@@ -74,13 +184,25 @@ def _create_pca_reducer(n_components: int, parameters: Dict[str, Any], random_st
         params['tol'] = parameters['tol']
     if 'iterated_power' in parameters and parameters.get('svd_solver') == 'randomized':
         params['iterated_power'] = int(parameters['iterated_power'])
+    
+    if gpu_available():
+        # cuML only offers the 'full' and 'jacobi' solvers
+        gpu_params = {k: v for k, v in params.items() if k not in ('svd_solver', 'tol', 'iterated_power')}
+        return _CumlReducer(cuPCA(**gpu_params))
         
     return PCA(**params)
 
 
 def _create_tsne_reducer(n_components: int, parameters: Dict[str, Any], random_state: int, 
                         X_scaled: np.ndarray = None):
-    """Create t-SNE reducer with specified parameters."""
+    """
+    Create t-SNE reducer with specified parameters.
+    
+    Uses openTSNE, whose FFT-accelerated interpolation replaces Barnes-Hut
+    for the gradient in up to two dimensions, when it is installed and the
+    user did not pick a sklearn-specific ``method``. Falls back to
+    sklearn's TSNE otherwise.
+    """
     from sklearn.manifold import TSNE
     
     params = {
@@ -120,6 +242,34 @@ def _create_tsne_reducer(n_components: int, parameters: Dict[str, Any], random_s
         params['init'] = parameters['init']
     if 'method' in parameters:
         params['method'] = parameters['method']
+    
+    if gpu_available() and n_components == 2:
+        # cuML's t-SNE only embeds in two dimensions
+        gpu_params = {
+            'n_components': n_components,
+            'perplexity': params['perplexity'],
+            'random_state': random_state,
+            'method': 'fft',
+        }
+        if 'early_exaggeration' in params:
+            gpu_params['early_exaggeration'] = params['early_exaggeration']
+        if isinstance(params.get('learning_rate'), (int, float)):
+            gpu_params['learning_rate'] = params['learning_rate']
+        return _CumlReducer(cuTSNE(**gpu_params))
+    
+    if OPENTSNE_AVAILABLE and 'method' not in params:
+        return _OpenTSNEReducer(
+            n_components=n_components,
+            perplexity=params['perplexity'],
+            early_exaggeration=params.get('early_exaggeration', 12),
+            learning_rate=params.get('learning_rate', 'auto'),
+            n_iter=params.get('max_iter', 500),
+            metric=params.get('metric', 'euclidean'),
+            initialization=params.get('init', 'pca'),
+            negative_gradient_method='fft' if n_components <= 2 else 'bh',
+            n_jobs=1,
+            random_state=random_state,
+        )
         
     return TSNE(**params)
 
@@ -144,10 +294,44 @@ def _create_umap_reducer(n_components: int, parameters: Dict[str, Any], random_s
         params['learning_rate'] = parameters['learning_rate']
     if 'metric' in parameters:
         params['metric'] = parameters['metric']
+    if 'init' in parameters:
+        params['init'] = parameters['init']
+    
+    if gpu_available():
+        # cuML only offers the 'spectral' and 'random' initialisations
+        if params.get('init') not in (None, 'spectral', 'random'):
+            del params['init']
+        return _CumlReducer(cuUMAP(**params))
         
     return umap.UMAP(**params)
 
 
+def warm_up_umap() -> None:
+    """
+    Compile UMAP's numba kernels with a throwaway fit.
+    
+    Notes
+    -----
+    The first UMAP fit in a process JIT-compiles its numba kernels, which
+    takes several seconds; later fits reuse the compiled code. Fitting a
+    small random matrix once at startup moves that cost off the first
+    ``/explain`` request. Every request still fits its own reducer, as each
+    neighbourhood needs its own embedding. Runs once per process and is a
+    no-op when the reducers run on cuML. A failing warm-up is logged and
+    left to the first real fit.
+    """
+    global _umap_warmed_up
+    if _umap_warmed_up or gpu_available():
+        return
+    _umap_warmed_up = True
+    
+    sample = np.random.RandomState(0).rand(60, 4)
+    try:
+        _create_umap_reducer(2, {'init': 'pca', 'n_epochs': 10}, 42).fit_transform(sample)
+    except Exception as e:
+        logging.warning(f"UMAP warm-up failed: {e}")
+
+
 def _create_mds_reducer(n_components: int, parameters: Dict[str, Any], random_state: int):
     """Create MDS reducer with specified parameters."""
     from sklearn.manifold import MDS
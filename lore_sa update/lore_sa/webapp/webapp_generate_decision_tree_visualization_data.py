@@ -1,5 +1,5 @@
 from typing import List, Optional, Dict, Any, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import numpy as np
 from sklearn.tree import DecisionTreeClassifier
 
@@ -366,9 +366,11 @@ def process_single_node_for_visualization(node: TreeNode) -> Dict[str, Any]:
     Notes
     -----
     Converts dataclass to dictionary and ensures all NumPy arrays
-    are converted to lists for JSON compatibility.
+    are converted to lists for JSON compatibility. TreeNode fields are flat,
+    so a shallow copy of the instance dictionary replaces ``asdict``, whose
+    recursive deep copy of ``value`` dominated the cost per node.
     """
-    node_dict = asdict(node)
+    node_dict = dict(vars(node))
     convert_numpy_arrays_to_lists(node_dict)
     return node_dict
 
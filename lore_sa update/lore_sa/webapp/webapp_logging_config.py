@@ -3,7 +3,9 @@ import os
 import sys
 import warnings
 import logging
-from logging.handlers import RotatingFileHandler
+import atexit
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 
 def configure_logging(log_level: str = None, log_file: str = None, 
@@ -87,6 +89,13 @@ def _configure_root_logger(log_level: str, log_file: str) -> None:
         Logging level string.
     log_file : str
         Path to log file.
+        
+    Notes
+    -----
+    The root logger only gets a QueueHandler, which formats each record and
+    puts it on an in-memory queue. A QueueListener thread writes the queued
+    lines to the console and file handlers, so logging from request handlers
+    never waits on stdout or disk I/O on the event loop.
     """
     numeric_level = getattr(logging, log_level, logging.INFO)
     
@@ -94,12 +103,24 @@ def _configure_root_logger(log_level: str, log_file: str) -> None:
         logging.StreamHandler(sys.stdout),
         RotatingFileHandler(log_file, maxBytes=10*1024*1024, backupCount=5)
     ]
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
     
     logging.basicConfig(
         level=numeric_level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=handlers
+        handlers=[queue_handler]
     )
+    
+    if queue_handler not in logging.getLogger().handlers:
+        # The root logger was already configured and basicConfig left it alone
+        for handler in handlers:
+            handler.close()
+        return
+    
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def _configure_library_loggers() -> None:
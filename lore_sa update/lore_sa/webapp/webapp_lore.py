@@ -1,17 +1,202 @@
-from typing import Dict, List, Tuple, Any, Union, Optional
+from typing import Dict, List, Tuple, Any, Union, Optional, Callable, Mapping
 import pandas as pd
 import numpy as np
 import logging
+import operator
 import os
+import hashlib
 import joblib
+from collections import OrderedDict
+import sklearn.ensemble
+import sklearn.tree
 from sklearn.pipeline import make_pipeline
-from sklearn.preprocessing import StandardScaler, OrdinalEncoder
-from sklearn.compose import ColumnTransformer
-import copy
+from sklearn.base import BaseEstimator, TransformerMixin
 
+from ..bbox import sklearn_classifier_bbox
+from ..dataset import TabularDataset
+from ..neighgen.genetic import GeneticGenerator
 from .routes.webapp_api_state import webapp_state
+from .webapp_datasets import load_dataset
+from .webapp_neighborhood_utils import remove_duplicates_with_instance_last
 
 target_name = 'target'
+predict_chunk_size = 512
+
+model_memo_size = 4
+# Part of every model cache file name. Bump it when the trained pipeline or
+# the cached layout changes, so models cached by an older version are
+# retrained instead of loaded.
+model_cache_version = 2
+# Store numeric features as float32 to halve memory traffic during training
+float32_features = os.environ.get("LORE_FLOAT32_FEATURES", "false").lower() == "true"
+_model_memo: 'OrderedDict[str, Tuple[Any, Any, Any, Any, List[str]]]' = OrderedDict()
+_created_cache_dirs = set()
+# Keep neighborhoods and surrogates on disk so an identical /explain request
+# is answered from the cache, also after a restart. Off by default because
+# the genetic generator would otherwise return a fresh neighborhood each time.
+persist_explanations = os.environ.get("LORE_PERSIST_EXPLANATIONS", "false").lower() == "true"
+# Digest of the last black box seen by ExplanationCache, reused while it is the same object
+_bbox_digest: Dict[str, Any] = {"bbox": None, "digest": None}
+
+try:
+    import lz4  # noqa: F401
+    CACHE_COMPRESSION = ('lz4', 1)
+except ImportError:
+    CACHE_COMPRESSION = 0
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def _descriptor_cached(dataset: Any, key: str, build: Any) -> Any:
+    """
+    Memoize a value derived from the dataset descriptor on the dataset.
+    
+    Parameters
+    ----------
+    dataset : Any
+        Dataset object owning the descriptor.
+    key : str
+        Name of the derived value.
+    build : Callable[[], Any]
+        Function computing the value on a cache miss.
+        
+    Returns
+    -------
+    Any
+        Cached or freshly computed value.
+        
+    Notes
+    -----
+    The descriptor does not change after the dataset is created, so
+    orderings derived from it only need to be computed once. The cache is
+    tied to the descriptor object itself and rebuilt if it is replaced.
+    """
+    cache = getattr(dataset, '_webapp_descriptor_cache', None)
+    if cache is None or cache['descriptor'] is not dataset.descriptor:
+        cache = {'descriptor': dataset.descriptor}
+        dataset._webapp_descriptor_cache = cache
+    if key not in cache:
+        cache[key] = build()
+    return cache[key]
+
+
+class InPlacePreprocessor(BaseEstimator, TransformerMixin):
+    """
+    Standard scaling and ordinal encoding written into a single output buffer.
+    
+    Equivalent to a ColumnTransformer combining StandardScaler on the numeric
+    columns and OrdinalEncoder on the categorical columns, without allocating
+    one intermediate array per transformer and concatenating them afterwards.
+    
+    Parameters
+    ----------
+    numeric_indices : List[int]
+        Column positions of numeric features.
+    categorical_indices : List[int]
+        Column positions of categorical features.
+    dtype : type, default=np.float64
+        Data type of the transformed output.
+    handle_unknown : str, default='error'
+        'error' raises on categories not seen during fit, 'use_encoded_value'
+        encodes them as ``unknown_value`` (as in OrdinalEncoder).
+    unknown_value : int, default=-1
+        Code given to unseen categories when ``handle_unknown`` is
+        'use_encoded_value'.
+        
+    Attributes
+    ----------
+    mean_ : np.ndarray
+        Per-column mean of the numeric features.
+    scale_ : np.ndarray
+        Per-column standard deviation of the numeric features (1.0 for
+        constant columns, as in StandardScaler).
+    categories_ : List[np.ndarray]
+        Sorted categories of each categorical feature.
+    """
+    
+    def __init__(self, numeric_indices: List[int], categorical_indices: List[int], 
+                 dtype: type = np.float64, handle_unknown: str = 'error',
+                 unknown_value: int = -1) -> None:
+        """Initialize preprocessor with column positions and output type."""
+        self.numeric_indices = numeric_indices
+        self.categorical_indices = categorical_indices
+        self.dtype = dtype
+        self.handle_unknown = handle_unknown
+        self.unknown_value = unknown_value
+    
+    def fit(self, X: Any, y: Any = None) -> 'InPlacePreprocessor':
+        """
+        Compute scaling statistics and category-to-code maps.
+        
+        Parameters
+        ----------
+        X : Any
+            Training features (array or DataFrame), addressed positionally.
+        y : Any, default=None
+            Ignored, present for pipeline compatibility.
+            
+        Returns
+        -------
+        InPlacePreprocessor
+            Fitted preprocessor.
+        """
+        X = np.asarray(X)
+        numeric = X[:, self.numeric_indices].astype(np.float64)
+        self.mean_ = numeric.mean(axis=0)
+        scale = numeric.std(axis=0)
+        scale[scale == 0.0] = 1.0
+        self.scale_ = scale
+        self.categories_ = [np.unique(X[:, index]) for index in self.categorical_indices]
+        return self
+    
+    def transform(self, X: Any) -> np.ndarray:
+        """
+        Scale numeric and encode categorical features into one buffer.
+        
+        Parameters
+        ----------
+        X : Any
+            Features to transform (array or DataFrame), addressed positionally.
+            
+        Returns
+        -------
+        np.ndarray
+            Numeric columns first, then categorical codes, as in the
+            ColumnTransformer layout.
+            
+        Raises
+        ------
+        ValueError
+            If a categorical column contains a category not seen during fit
+            and ``handle_unknown`` is 'error'.
+        """
+        X = np.asarray(X)
+        n_numeric = len(self.numeric_indices)
+        out = np.empty((X.shape[0], n_numeric + len(self.categorical_indices)), dtype=self.dtype)
+        
+        if n_numeric:
+            numeric = out[:, :n_numeric]
+            numeric[...] = X[:, self.numeric_indices]
+            np.subtract(numeric, self.mean_, out=numeric)
+            np.divide(numeric, self.scale_, out=numeric)
+        
+        for offset, (index, categories) in enumerate(zip(self.categorical_indices, self.categories_)):
+            column = X[:, index]
+            codes = np.searchsorted(categories, column)
+            codes = np.minimum(codes, len(categories) - 1)
+            known = categories[codes] == column
+            if not known.all():
+                if self.handle_unknown != 'use_encoded_value':
+                    raise ValueError(f"Found unknown categories in column {index} during transform")
+                codes[~known] = self.unknown_value
+            out[:, n_numeric + offset] = codes
+        
+        return out
 
 
 class DatasetProcessor:
@@ -39,8 +224,14 @@ class DatasetProcessor:
     def __init__(self, dataset: Any) -> None:
         """Initialize processor with dataset and extract feature indices."""
         self.dataset = dataset
-        self.numeric_indices = [v['index'] for v in dataset.descriptor['numeric'].values()]
-        self.categorical_indices = [v['index'] for v in dataset.descriptor['categorical'].values()]
+        self.numeric_indices = _descriptor_cached(
+            dataset, 'numeric_indices', 
+            lambda: [v['index'] for v in dataset.descriptor['numeric'].values()]
+        )
+        self.categorical_indices = _descriptor_cached(
+            dataset, 'categorical_indices', 
+            lambda: [v['index'] for v in dataset.descriptor['categorical'].values()]
+        )
 
     def get_ordered_feature_names(self) -> List[str]:
         """
@@ -51,50 +242,118 @@ class DatasetProcessor:
         List[str]
             Feature names sorted by their original column indices.
         """
-        features = []
-        for name, info in self.dataset.descriptor['numeric'].items():
-            features.append((info['index'], name))
-        for name, info in self.dataset.descriptor['categorical'].items():
-            features.append((info['index'], name))
-        features.sort(key=lambda x: x[0])
-        return [name for _, name in features]
+        return list(_descriptor_cached(self.dataset, 'ordered_feature_names', self._build_ordered_feature_names))
+    
+    def get_feature_name_set(self) -> frozenset:
+        """
+        Return the feature names as a frozenset, computed once per descriptor.
+        
+        Returns
+        -------
+        frozenset
+            Names of all numeric and categorical features.
+        """
+        return _descriptor_cached(
+            self.dataset, 'feature_name_set', lambda: frozenset(self.get_ordered_feature_names())
+        )
     
-    def create_preprocessor(self) -> ColumnTransformer:
+    def get_feature_getter(self) -> Callable[[Mapping[str, Any]], Tuple[Any, ...]]:
         """
-        Create sklearn preprocessing pipeline for mixed data types.
+        Build a getter that pulls feature values out of a mapping in index order.
         
         Returns
         -------
-        ColumnTransformer
-            Preprocessing pipeline with standard scaling for numeric features
+        Callable[[Mapping[str, Any]], Tuple[Any, ...]]
+            Function returning the values of the ordered features as a tuple.
+            
+        Notes
+        -----
+        The getter is an ``operator.itemgetter`` cached with the descriptor,
+        so per-request lookups run in C instead of a Python loop.
+        """
+        return _descriptor_cached(self.dataset, 'feature_getter', self._build_feature_getter)
+    
+    def _build_feature_getter(self) -> Callable[[Mapping[str, Any]], Tuple[Any, ...]]:
+        """Create the itemgetter over the ordered feature names."""
+        names = self.get_ordered_feature_names()
+        if len(names) == 1:
+            # itemgetter with a single key returns a scalar, not a tuple
+            name = names[0]
+            return lambda mapping: (mapping[name],)
+        return operator.itemgetter(*names)
+    
+    def _build_ordered_feature_names(self) -> List[str]:
+        """
+        Scan the descriptor for feature names sorted by column index.
+        
+        Column indices are small integers, so every name is written into its
+        index slot and the unused slots (e.g. the target column) are dropped,
+        instead of sorting (index, name) pairs.
+        """
+        columns = {
+            info['index']: name
+            for kind in ('numeric', 'categorical')
+            for name, info in self.dataset.descriptor[kind].items()
+        }
+        if not columns:
+            return []
+        slots = [None] * (max(columns) + 1)
+        for index, name in columns.items():
+            slots[index] = name
+        return [name for name in slots if name is not None]
+    
+    def create_preprocessor(self, dtype: type = np.float64) -> InPlacePreprocessor:
+        """
+        Create sklearn preprocessing step for mixed data types.
+        
+        Parameters
+        ----------
+        dtype : type, default=np.float64
+            Data type of the preprocessed features handed to the classifier.
+        
+        Returns
+        -------
+        InPlacePreprocessor
+            Preprocessing step with standard scaling for numeric features
             and ordinal encoding for categorical features.
         """
-        return ColumnTransformer([
-            ('num', StandardScaler(), self.numeric_indices),
-            ('cat', OrdinalEncoder(), self.categorical_indices)
-        ])
+        # Categories dropped with filtered training rows can still appear in
+        # generated neighbourhoods, so they are encoded instead of rejected
+        return InPlacePreprocessor(self.numeric_indices, self.categorical_indices, dtype=dtype,
+                                   handle_unknown='use_encoded_value', unknown_value=-1)
     
-    def prepare_for_training(self) -> Tuple[pd.DataFrame, pd.Series]:
+    def prepare_for_training(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Prepare dataset for model training by filtering and splitting.
         
         Returns
         -------
-        Tuple[pd.DataFrame, pd.Series]
-            Feature DataFrame and target Series ready for training.
+        Tuple[np.ndarray, np.ndarray]
+            Feature array and target array ready for training.
             
         Notes
         -----
         Filters out classes with single instances to prevent training issues.
-        Selects features based on numeric and categorical indices.
+        Class sizes come from one factorize pass and a bincount, and the
+        filtered copy of the DataFrame is only made when some class actually
+        has to be dropped. Features are selected positionally from
+        the cached numeric and categorical indices and handed to sklearn as
+        a NumPy array, without copying again when pandas can expose the
+        selected block directly.
         """
-        class_counts = self.dataset.df[target_name].value_counts()
-        valid_classes = class_counts[class_counts > 1].index
-        self.dataset.df = self.dataset.df[self.dataset.df[target_name].isin(valid_classes)]
+        codes, _ = pd.factorize(self.dataset.df[target_name])
+        # Missing targets get code -1; the extra trailing False drops them
+        valid_codes = np.append(np.bincount(codes[codes >= 0]) > 1, False)
+        keep = valid_codes[codes]
+        if not keep.all():
+            self.dataset.df = self.dataset.df[keep]
         
-        feature_indices = self.numeric_indices + self.categorical_indices
-        X = self.dataset.df.iloc[:, feature_indices]
-        y = self.dataset.df[target_name]
+        feature_indices = _descriptor_cached(
+            self.dataset, 'training_feature_indices', 
+            lambda: np.asarray(self.numeric_indices + self.categorical_indices, dtype=np.intp)
+        )
+        X = self.dataset.df.take(feature_indices, axis=1).to_numpy(copy=False)
+        y = self.dataset.df[target_name].to_numpy(copy=False)
         
         return X, y
 
@@ -110,17 +369,25 @@ class ModelTrainer:
     ----------
     cache_dir : str, default='webapp cache'
         Directory path for storing cached model artifacts.
+    auto_size_forest : bool, default=False
+        Whether random forests get a number of trees scaled to the
+        training set size, with ``n_estimators`` as the upper bound.
         
     Attributes
     ----------
     cache_dir : str
         Path to cache directory.
+    auto_size_forest : bool
+        Whether random forests are sized to the training set.
     """
     
-    def __init__(self, cache_dir: str = 'webapp cache') -> None:
+    def __init__(self, cache_dir: str = 'webapp cache', auto_size_forest: bool = False) -> None:
         """Initialize trainer with cache directory setup."""
         self.cache_dir = cache_dir
-        os.makedirs(cache_dir, exist_ok=True)
+        self.auto_size_forest = auto_size_forest
+        if cache_dir not in _created_cache_dirs:
+            os.makedirs(cache_dir, exist_ok=True)
+            _created_cache_dirs.add(cache_dir)
     
     def _get_cache_path(self, dataset_name: str, classifier_name: str, params_hash: str) -> str:
         """
@@ -139,10 +406,17 @@ class ModelTrainer:
         -------
         str
             Full path to cache file.
+            
+        Notes
+        -----
+        The name ends with ``model_cache_version``, so files written before
+        a format change are never picked up for the same parameters.
         """
+        dtype_suffix = '_float32' if float32_features else ''
         return os.path.join(
             self.cache_dir, 
-            f'classifier_{dataset_name}_target_{classifier_name}_{params_hash}.pkl'
+            f'classifier_{dataset_name}_target_{classifier_name}_{params_hash}{dtype_suffix}'
+            f'_v{model_cache_version}.pkl'
         )
     
     def train_or_load_model(self, dataset_name: str, classifier: Any = None) -> Tuple[Any, Any, List[str]]:
@@ -160,15 +434,47 @@ class ModelTrainer:
         -------
         Tuple[Any, Any, List[str]]
             Trained model bbox, dataset object, and feature names.
+            
+        Notes
+        -----
+        The ``model_memo_size`` most recently used models are also kept in
+        memory, so selecting the same configuration again in the same
+        process neither touches the disk cache nor retrains. Auto-sized
+        forests are cached under their own key.
         """
-        params_hash = joblib.hash(classifier.get_params())
+        params = classifier.get_params()
+        if self.auto_size_forest:
+            params = {**params, 'auto_size_forest': True}
+        params_hash = joblib.hash(params)
         cache_path = self._get_cache_path(dataset_name, classifier.__class__.__name__, params_hash)
         
+        if cache_path in _model_memo:
+            _model_memo.move_to_end(cache_path)
+            bbox, X, y, dataset, feature_names = _model_memo[cache_path]
+            self._update_webapp_state(X, y)
+            return bbox, dataset, feature_names
+        
         if os.path.exists(cache_path):
             return self._load_from_cache(cache_path)
         
         return self._train_and_cache(dataset_name, classifier, cache_path)
     
+    def _remember(self, cache_path: str, cache_data: Tuple[Any, Any, Any, Any, List[str]]) -> None:
+        """
+        Keep model artifacts in the in-process memo, evicting the oldest.
+        
+        Parameters
+        ----------
+        cache_path : str
+            Cache file path identifying the model configuration.
+        cache_data : Tuple[Any, Any, Any, Any, List[str]]
+            Model bbox, training features and targets, dataset, and feature names.
+        """
+        _model_memo[cache_path] = cache_data
+        _model_memo.move_to_end(cache_path)
+        while len(_model_memo) > model_memo_size:
+            _model_memo.popitem(last=False)
+    
     def _load_from_cache(self, cache_path: str) -> Tuple[Any, Any, List[str]]:
         """
         Load model artifacts from cache file.
@@ -182,10 +488,24 @@ class ModelTrainer:
         -------
         Tuple[Any, Any, List[str]]
             Cached model bbox, dataset, and feature names.
+            
+        Notes
+        -----
+        Uncompressed caches are loaded with ``mmap_mode='r'`` so their numeric
+        arrays are backed by the page cache instead of being read in full.
+        Compressed caches cannot be memory mapped and are loaded normally.
+        Training arrays stored next to the cache file (see
+        ``_save_to_cache``) are read back with ``_load_array``.
         """
-        cached_data = joblib.load(cache_path)
-        bbox, X, y, dataset, feature_names = cached_data
+        mmap_mode = None if CACHE_COMPRESSION else 'r'
+        bbox, X, y, dataset, feature_names = joblib.load(cache_path, mmap_mode=mmap_mode)
+        if X is None:
+            X = self._load_array(cache_path, 'X')
+        if y is None:
+            y = self._load_array(cache_path, 'y')
+        cached_data = (bbox, X, y, dataset, feature_names)
         logging.info(f"Loaded model from webapp cache: {cache_path}")
+        self._remember(cache_path, cached_data)
         self._update_webapp_state(X, y)
         return bbox, dataset, feature_names
     
@@ -206,6 +526,11 @@ class ModelTrainer:
         -------
         Tuple[Any, Any, List[str]]
             Trained model bbox, dataset object, and feature names.
+            
+        Notes
+        -----
+        The cache is written with LZ4 compression when the lz4 package is
+        installed, and uncompressed (memory-mappable) otherwise.
         """
         X, y, feature_names, target_names = self._load_raw_dataset(dataset_name)
         data_dict = self._create_data_dict(X, y, feature_names, target_names)
@@ -214,12 +539,134 @@ class ModelTrainer:
         bbox, X, y = self._train_model(dataset, classifier)
         
         cache_data = (bbox, X, y, dataset, feature_names)
-        joblib.dump(cache_data, cache_path)
+        self._save_to_cache(cache_path, cache_data)
         logging.info(f"Cached model to: {cache_path}")
+        self._remember(cache_path, cache_data)
         
         self._update_webapp_state(X, y)
         return bbox, dataset, feature_names
     
+    def _get_array_path(self, cache_path: str, array_name: str, extension: str = 'npy') -> str:
+        """
+        Generate path of a training array stored next to a cache file.
+        
+        Parameters
+        ----------
+        cache_path : str
+            Path of the cache file holding the model artifacts.
+        array_name : str
+            Name of the stored array ('X' or 'y').
+        extension : str, default='npy'
+            File format of the stored array ('npy' or 'parquet').
+            
+        Returns
+        -------
+        str
+            Full path to the array file.
+        """
+        return f'{os.path.splitext(cache_path)[0]}_{array_name}.{extension}'
+    
+    def _save_object_array(self, path: str, array: np.ndarray) -> bool:
+        """
+        Write an object array column by column to a parquet file.
+        
+        Parameters
+        ----------
+        path : str
+            Destination parquet file.
+        array : np.ndarray
+            1D or 2D object array (mixed or string data).
+            
+        Returns
+        -------
+        bool
+            True if the array was written, False if pyarrow is missing or
+            a column has no single Arrow type.
+        """
+        if not PYARROW_AVAILABLE:
+            return False
+        columns = array.reshape(len(array), -1)
+        try:
+            table = pa.Table.from_arrays(
+                [pa.array(columns[:, j]) for j in range(columns.shape[1])],
+                names=[str(j) for j in range(columns.shape[1])]
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return False
+        pq.write_table(table, path)
+        return True
+    
+    def _load_array(self, cache_path: str, array_name: str) -> np.ndarray:
+        """
+        Read a training array stored next to a cache file.
+        
+        Parameters
+        ----------
+        cache_path : str
+            Path of the cache file holding the model artifacts.
+        array_name : str
+            Name of the stored array ('X' or 'y').
+            
+        Returns
+        -------
+        np.ndarray
+            Memory-mapped numeric array, or object array rebuilt from its
+            parquet columns.
+        """
+        npy_path = self._get_array_path(cache_path, array_name)
+        if os.path.exists(npy_path):
+            return np.load(npy_path, mmap_mode='r')
+        
+        frame = pq.read_table(self._get_array_path(cache_path, array_name, 'parquet')).to_pandas(
+            self_destruct=True
+        )
+        array = frame.to_numpy(dtype=object)
+        return array[:, 0] if array_name == 'y' else array
+    
+    def _save_to_cache(self, cache_path: str, cache_data: Tuple[Any, Any, Any, Any, List[str]]) -> None:
+        """
+        Write model artifacts to cache, storing numeric arrays separately.
+        
+        Parameters
+        ----------
+        cache_path : str
+            Path of the cache file holding the model artifacts.
+        cache_data : Tuple[Any, Any, Any, Any, List[str]]
+            Model bbox, training features and targets, dataset, and feature names.
+            
+        Notes
+        -----
+        Numeric training arrays are saved as C-ordered ``.npy`` files so they
+        can be memory mapped on load, even when the rest of the cache is
+        compressed. Object arrays (mixed or string data) are saved column by
+        column as parquet when pyarrow is installed, and otherwise stay in
+        the cache file. The arrays are written first, and the cache file is
+        written under a temporary name and renamed into place, so an
+        existing cache file is always complete and has its arrays next to
+        it, even if training is interrupted or two requests race.
+        """
+        bbox, X, y, dataset, feature_names = cache_data
+        stored = {}
+        for array_name, array in (('X', X), ('y', y)):
+            array = np.asarray(array)
+            if np.issubdtype(array.dtype, np.number):
+                np.save(self._get_array_path(cache_path, array_name), np.ascontiguousarray(array))
+                stored[array_name] = None
+            elif self._save_object_array(self._get_array_path(cache_path, array_name, 'parquet'), array):
+                stored[array_name] = None
+            else:
+                stored[array_name] = array
+        
+        root, extension = os.path.splitext(cache_path)
+        temporary_path = f'{root}.{os.getpid()}.tmp{extension}'
+        try:
+            joblib.dump((bbox, stored['X'], stored['y'], dataset, feature_names), temporary_path, 
+                        compress=CACHE_COMPRESSION, protocol=5)
+            os.replace(temporary_path, cache_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+    
     def _load_raw_dataset(self, dataset_name: str) -> Tuple[Any, np.ndarray, List[str], List[str]]:
         """
         Load raw dataset from webapp datasets module.
@@ -234,12 +681,11 @@ class ModelTrainer:
         Tuple[Any, np.ndarray, List[str], List[str]]
             Raw dataset data, target array, feature names, and target names.
         """
-        from .webapp_datasets import load_dataset
         raw_dataset, feature_names, target_names = load_dataset(dataset_name)
         return raw_dataset.data, raw_dataset.target, feature_names, target_names
     
     def _create_data_dict(self, X: Any, y: np.ndarray, feature_names: List[str], 
-                         target_names: List[str]) -> Dict[str, Any]:
+                         target_names: List[str]) -> Union[Dict[str, Any], pd.DataFrame]:
         """
         Convert raw data to dictionary format for dataset creation.
         
@@ -256,42 +702,100 @@ class ModelTrainer:
             
         Returns
         -------
-        Dict[str, Any]
-            Dictionary with feature columns and target labels.
+        Union[Dict[str, Any], pd.DataFrame]
+            Feature columns and target labels, as a dictionary for DataFrame
+            input and as a DataFrame for array input.
+            
+        Notes
+        -----
+        Numeric features are stored as float32 instead of float64 when the
+        ``LORE_FLOAT32_FEATURES`` environment variable is "true". Array input
+        is wrapped in a DataFrame as one column-major block, which pandas
+        adopts without splitting it into per-column arrays and copying them
+        back together.
         """
         data_dict = {}
+        numeric_dtype = np.float32 if float32_features else np.float64
         
         if isinstance(X, pd.DataFrame):
+            dtypes = X.dtypes
             for name in feature_names:
                 series = X[name]
-                data_dict[name] = series.astype(float).values if pd.api.types.is_numeric_dtype(series) else series.astype(str).values
+                if pd.api.types.is_numeric_dtype(dtypes[name]):
+                    data_dict[name] = series.to_numpy(dtype=numeric_dtype, copy=False)
+                else:
+                    data_dict[name] = series.astype(str).to_numpy()
         else:
             X_array = X.to_numpy() if not isinstance(X, np.ndarray) else X
-            data_dict = {name: X_array[:, i] for i, name in enumerate(feature_names)}
+            # Column-major copy so every feature column below is a contiguous view
+            if np.issubdtype(X_array.dtype, np.floating):
+                X_array = np.asfortranarray(X_array, dtype=numeric_dtype)
+            else:
+                X_array = np.asfortranarray(X_array)
+            data_dict = pd.DataFrame(X_array, columns=feature_names, copy=False)
         
-        data_dict['target'] = [target_names[i] for i in y]
+        data_dict['target'] = np.asarray(target_names, dtype=object)[np.asarray(y, dtype=np.intp)]
         return data_dict
     
-    def _create_tabular_dataset(self, data_dict: Dict[str, Any]) -> Any:
+    def _create_tabular_dataset(self, data_dict: Union[Dict[str, Any], pd.DataFrame]) -> Any:
         """
         Create TabularDataset object from data dictionary.
         
         Parameters
         ----------
-        data_dict : Dict[str, Any]
-            Dictionary containing feature and target data.
+        data_dict : Union[Dict[str, Any], pd.DataFrame]
+            Feature and target data.
             
         Returns
         -------
         Any
             TabularDataset object with cleaned data.
+            
+        Notes
+        -----
+        ``dropna`` only runs when some column actually holds missing values,
+        so clean datasets skip building the row mask and the filtered frame.
         """
-        from lore_sa.dataset import TabularDataset
-        dataset = TabularDataset.from_dict(data_dict, 'target')
-        dataset.df.dropna(inplace=True)
+        if isinstance(data_dict, pd.DataFrame):
+            dataset = TabularDataset(data_dict, class_name='target')
+        else:
+            dataset = TabularDataset.from_dict(data_dict, 'target')
+        if self._has_missing_values(dataset.df):
+            dataset.df.dropna(inplace=True)
         return dataset
     
-    def _train_model(self, dataset: Any, classifier: Any) -> Tuple[Any, pd.DataFrame, pd.Series]:
+    def _has_missing_values(self, df: pd.DataFrame) -> bool:
+        """
+        Check whether any cell of the DataFrame is missing.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Data to check.
+            
+        Returns
+        -------
+        bool
+            True as soon as one column with missing values is found.
+            
+        Notes
+        -----
+        Integer and boolean columns cannot hold NaN and are skipped, float
+        columns are checked with ``np.isnan`` and the remaining ones with
+        ``pd.isna``, one column at a time.
+        """
+        for name, dtype in df.dtypes.items():
+            if isinstance(dtype, np.dtype) and dtype.kind in 'iub':
+                continue
+            column = df[name].to_numpy(copy=False)
+            if isinstance(dtype, np.dtype) and dtype.kind == 'f':
+                if np.isnan(column).any():
+                    return True
+            elif pd.isna(column).any():
+                return True
+        return False
+    
+    def _train_model(self, dataset: Any, classifier: Any) -> Tuple[Any, np.ndarray, np.ndarray]:
         """
         Train classifier on processed dataset.
         
@@ -304,29 +808,118 @@ class ModelTrainer:
             
         Returns
         -------
-        Tuple[Any, pd.DataFrame, pd.Series]
+        Tuple[Any, np.ndarray, np.ndarray]
             Black box wrapper, training features, and training targets.
         """
-        from lore_sa.bbox import sklearn_classifier_bbox
-        
         processor = DatasetProcessor(dataset)
-        preprocessor = processor.create_preprocessor()
+        preprocessor = processor.create_preprocessor(self._feature_dtype(classifier))
         model = make_pipeline(preprocessor, classifier)
         
         X, y = processor.prepare_for_training()
-        model.fit(X, y)
+        if self.auto_size_forest:
+            self._size_forest(classifier, len(y))
+        self._fit_in_parallel(model, classifier, X, y)
         
         return sklearn_classifier_bbox.sklearnBBox(model), X, y
     
-    def _update_webapp_state(self, X: pd.DataFrame, y: pd.Series) -> None:
+    def _feature_dtype(self, classifier: Any) -> type:
+        """
+        Pick the preprocessed feature type the classifier works in.
+        
+        Parameters
+        ----------
+        classifier : Any
+            Sklearn classifier about to be trained.
+            
+        Returns
+        -------
+        type
+            np.float32 for tree-based classifiers, np.float64 otherwise.
+            
+        Notes
+        -----
+        Sklearn trees compare node thresholds in float32 and cast float64
+        input to a float32 copy on every fit and predict call. Producing
+        float32 directly in the preprocessor avoids that second buffer for
+        each neighborhood prediction chunk. Classes are looked up on the
+        sklearn modules at call time so accelerated replacements installed
+        by ``LORE_ACCEL`` are recognised.
+        """
+        tree_classifiers = (sklearn.ensemble.RandomForestClassifier, 
+                            sklearn.ensemble.GradientBoostingClassifier, 
+                            sklearn.tree.DecisionTreeClassifier)
+        if isinstance(classifier, tree_classifiers):
+            return np.float32
+        return np.float64
+    
+    def _size_forest(self, classifier: Any, n_rows: int) -> None:
+        """
+        Scale the number of random forest trees to the training set size.
+        
+        Parameters
+        ----------
+        classifier : Any
+            Sklearn classifier about to be trained.
+        n_rows : int
+            Number of training rows left after filtering rare classes.
+            
+        Notes
+        -----
+        Only called when ``auto_size_forest`` is set, and only applies to a
+        RandomForestClassifier. The forest gets ``2 * sqrt(n_rows)`` trees,
+        at least 20 and at most its ``n_estimators``, since prediction
+        time, the hot path during neighborhood generation, grows linearly
+        with the number of trees.
+        """
+        if not isinstance(classifier, sklearn.ensemble.RandomForestClassifier):
+            return
+        
+        n_estimators = int(min(classifier.n_estimators, max(20, np.sqrt(n_rows) * 2)))
+        classifier.set_params(n_estimators=n_estimators)
+        logging.info(f"Using {n_estimators} trees for {n_rows} training rows")
+    
+    def _fit_in_parallel(self, model: Any, classifier: Any, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Fit the pipeline, building forest trees on all available cores.
+        
+        Parameters
+        ----------
+        model : Any
+            Pipeline wrapping the classifier.
+        classifier : Any
+            Final estimator of the pipeline.
+        X : np.ndarray
+            Training features.
+        y : np.ndarray
+            Training targets.
+            
+        Notes
+        -----
+        Forests left at ``n_jobs=None`` are fitted with ``n_jobs=-1`` and
+        reset to None afterwards, so that prediction on small neighbourhood
+        chunks stays serial instead of paying thread start-up for every
+        call. An ``n_jobs`` chosen by the user is left untouched, so the
+        cached model keeps the parameters its cache key was built from.
+        """
+        if not isinstance(classifier, sklearn.ensemble.RandomForestClassifier) or classifier.n_jobs is not None:
+            model.fit(X, y)
+            return
+        
+        classifier.set_params(n_jobs=-1)
+        try:
+            model.fit(X, y)
+        finally:
+            classifier.set_params(n_jobs=None)
+    
+    def _update_webapp_state(self, X: np.ndarray, y: np.ndarray) -> None:
         """
         Update global webapp state with training data.
         
         Parameters
         ----------
-        X : pd.DataFrame
+        X : np.ndarray
             Training feature data.
-        y : pd.Series
+        y : np.ndarray
             Training target data.
         """
         webapp_state.X = X
@@ -391,75 +984,103 @@ class NeighborhoodGenerator:
         encoded_instance = encoded_instance[0]
 
         if webapp_state.generator is None:
-            from ..neighgen.genetic import GeneticGenerator
             webapp_state.generator = GeneticGenerator(webapp_state.bbox, webapp_state.dataset, webapp_state.encoder, 0.1)
         
-        neighborhood = webapp_state.generator.generate(copy.deepcopy(encoded_instance), neighborhood_size, 
+        neighborhood = webapp_state.generator.generate(encoded_instance.copy(), neighborhood_size, 
                                         self.dataset.descriptor, webapp_state.encoder)
+        # Deduplication and decoding walk the neighborhood row by row
+        neighborhood = np.ascontiguousarray(neighborhood)
         
         if not keepDuplicates:
-            neighborhood = self._remove_duplicates(neighborhood)
-        neighborhood = self._ensure_instance_at_end(copy.deepcopy(encoded_instance), neighborhood)
+            neighborhood = remove_duplicates_with_instance_last(neighborhood, encoded_instance)
+        else:
+            neighborhood = self._ensure_instance_at_end(encoded_instance, neighborhood)
         decoded_neighborhood = webapp_state.encoder.decode(neighborhood)
+        predictions = self._predict_in_chunks(decoded_neighborhood)
         decoded_neighborhood = self._to_dataframe(decoded_neighborhood)
 
-        predictions = self.bbox.predict(decoded_neighborhood)
         encoded_predictions = webapp_state.encoder.encode_target_class(predictions.reshape(-1, 1)).squeeze()
         
         return (neighborhood, encoded_predictions, 
                 decoded_neighborhood, predictions, 
                 self._get_encoded_feature_names())
     
-    def _prepare_instance(self, instance: Union[Dict[str, Any], pd.Series, pd.DataFrame]) -> pd.DataFrame:
+    def _predict_in_chunks(self, decoded_neighborhood: np.ndarray) -> np.ndarray:
         """
-        Convert instance to properly formatted DataFrame.
+        Predict neighborhood labels with the black box in fixed-size chunks.
         
         Parameters
         ----------
-        instance : Union[Dict[str, Any], pd.Series, pd.DataFrame]
-            Instance in various possible formats.
+        decoded_neighborhood : np.ndarray
+            Neighborhood samples in the original feature space.
             
         Returns
         -------
-        pd.DataFrame
-            Standardized DataFrame with correct feature order and types.
+        np.ndarray
+            Black box predictions for every neighborhood row.
+            
+        Notes
+        -----
+        Ensemble models allocate per-sample probability buffers while
+        predicting, so large neighborhoods are predicted ``predict_chunk_size``
+        rows at a time to keep that memory bounded. Neighborhoods that fit
+        in a single chunk are predicted with one call.
         """
-        if isinstance(instance, pd.Series):
-            instance_dict = instance.to_dict()
-            instance_df = pd.DataFrame([{f: instance_dict[f] for f in self.feature_names}])
-        elif isinstance(instance, dict):
-            instance_df = pd.DataFrame([{f: instance[f] for f in self.feature_names}])
-        else:
-            instance_df = instance[self.feature_names].copy() if hasattr(instance, 'columns') else instance
+        n_rows = len(decoded_neighborhood)
+        if n_rows <= predict_chunk_size:
+            return self.bbox.predict(decoded_neighborhood)
         
-        for col in instance_df.columns:
-            if col in self.dataset.df.columns:
-                instance_df[col] = instance_df[col].astype(self.dataset.df[col].dtype)
-        
-        return instance_df
+        return np.concatenate([
+            self.bbox.predict(decoded_neighborhood[start:start + predict_chunk_size])
+            for start in range(0, n_rows, predict_chunk_size)
+        ])
     
-    def _remove_duplicates(self, neighborhood: np.ndarray) -> np.ndarray:
+    def _prepare_instance(self, instance: Union[Dict[str, Any], pd.Series, pd.DataFrame]) -> pd.DataFrame:
         """
-        Remove duplicate rows from neighborhood array.
+        Convert instance to properly formatted DataFrame.
         
         Parameters
         ----------
-        neighborhood : np.ndarray
-            Neighborhood samples potentially containing duplicates.
+        instance : Union[Dict[str, Any], pd.Series, pd.DataFrame]
+            Instance in various possible formats.
             
         Returns
         -------
-        np.ndarray
-            Neighborhood with duplicate rows removed.
+        pd.DataFrame
+            Standardized DataFrame with correct feature order and types.
+            
+        Notes
+        -----
+        A DataFrame already holding the features in order with the dataset
+        dtypes is returned unchanged. Dicts and Series are built column by
+        column with the dataset dtypes, so no second ``astype`` pass over a
+        freshly constructed frame is needed.
         """
-        unique_rows = []
-        seen = set()
-        for row in neighborhood:
-            row_tuple = tuple(row)
-            if row_tuple not in seen:
-                unique_rows.append(row)
-                seen.add(row_tuple)
-        return np.array(unique_rows, dtype=neighborhood.dtype)
+        dataset_dtypes = self.dataset.df.dtypes
+        
+        if isinstance(instance, pd.Series):
+            instance = instance.to_dict()
+        if isinstance(instance, dict):
+            columns = {}
+            for f in self.feature_names:
+                dtype = dataset_dtypes.get(f)
+                if isinstance(dtype, np.dtype):
+                    columns[f] = np.array([instance[f]], dtype=dtype)
+                else:
+                    columns[f] = pd.Series([instance[f]], dtype=dtype)
+            return pd.DataFrame(columns)
+        
+        if not hasattr(instance, 'columns'):
+            return instance
+        if list(instance.columns) == self.feature_names and all(
+            dataset_dtypes.get(col) == dtype for col, dtype in instance.dtypes.items()
+        ):
+            return instance
+        
+        instance_df = instance[self.feature_names].copy()
+        return instance_df.astype(
+            {col: dataset_dtypes[col] for col in instance_df.columns if col in dataset_dtypes.index}
+        )
     
     def _ensure_instance_at_end(self, instance: np.ndarray, neighborhood: np.ndarray) -> np.ndarray:
         """
@@ -476,11 +1097,21 @@ class NeighborhoodGenerator:
         -------
         np.ndarray
             Neighborhood with original instance appended.
+            
+        Notes
+        -----
+        Writes both parts into one preallocated array instead of stacking,
+        which would first materialize the reshaped instance and then copy
+        everything again.
         """
-        instance = np.array(instance) if not isinstance(instance, np.ndarray) else instance
-        neighborhood = np.array(neighborhood) if not isinstance(neighborhood, np.ndarray) else neighborhood
+        instance = np.asarray(instance).reshape(-1)
+        neighborhood = np.asarray(neighborhood)
         
-        return np.vstack([neighborhood, instance.reshape(1, -1)])
+        n_rows = neighborhood.shape[0]
+        out = np.empty((n_rows + 1, instance.shape[0]), dtype=np.result_type(neighborhood, instance))
+        out[:n_rows] = neighborhood
+        out[n_rows] = instance
+        return out
     
     def _to_dataframe(self, data: np.ndarray) -> pd.DataFrame:
         """
@@ -496,7 +1127,7 @@ class NeighborhoodGenerator:
         pd.DataFrame
             DataFrame with proper column names.
         """
-        return pd.DataFrame(data, columns=self.feature_names) if isinstance(data, np.ndarray) else data
+        return pd.DataFrame(np.ascontiguousarray(data), columns=self.feature_names) if isinstance(data, np.ndarray) else data
 
     def _get_encoded_feature_names(self) -> List[str]:
         """
@@ -510,8 +1141,13 @@ class NeighborhoodGenerator:
         Notes
         -----
         Numeric features keep original names, categorical features
-        are expanded with one-hot encoding naming convention.
+        are expanded with one-hot encoding naming convention. Computed
+        once per dataset descriptor.
         """
+        return list(_descriptor_cached(self.dataset, 'encoded_feature_names', self._build_encoded_feature_names))
+    
+    def _build_encoded_feature_names(self) -> List[str]:
+        """Scan the descriptor for encoded feature names."""
         names = []
         
         for name, info in sorted(self.dataset.descriptor['numeric'].items(), 
@@ -527,7 +1163,8 @@ class NeighborhoodGenerator:
 
 
 def load_cached_classifier(dataset_name: str, classifier: Any = None, 
-                         classifier_name: str = None) -> Tuple[Any, Any, List[str]]:
+                         classifier_name: str = None, 
+                         auto_size_forest: bool = False) -> Tuple[Any, Any, List[str]]:
     """
     Load cached classifier or train and cache new one.
     
@@ -539,13 +1176,15 @@ def load_cached_classifier(dataset_name: str, classifier: Any = None,
         Sklearn classifier instance.
     classifier_name : str
         Name of classifier type (for logging).
+    auto_size_forest : bool, default=False
+        Whether a random forest is sized to the training set.
         
     Returns
     -------
     Tuple[Any, Any, List[str]]
         Trained model, dataset object, and feature names.
     """
-    trainer = ModelTrainer()
+    trainer = ModelTrainer(auto_size_forest=auto_size_forest)
     return trainer.train_or_load_model(dataset_name, classifier)
 
 
@@ -593,4 +1232,119 @@ def train_surrogate(neighbour: np.ndarray, encoded_predictions: np.ndarray) -> N
     Updates webapp_state.surrogate with trained model.
     """
     webapp_state.surrogate.train(neighbour, encoded_predictions)
-    
\ No newline at end of file
+    
+
+
+class ExplanationCache:
+    """
+    Disk cache of neighborhoods and trained surrogates for /explain requests.
+    
+    Parameters
+    ----------
+    cache_dir : str, default='webapp cache'
+        Directory path for storing cached explanation artifacts.
+        
+    Attributes
+    ----------
+    cache_dir : str
+        Path to cache directory.
+    """
+    
+    def __init__(self, cache_dir: str = 'webapp cache') -> None:
+        """Initialize cache with cache directory setup."""
+        self.cache_dir = cache_dir
+        if cache_dir not in _created_cache_dirs:
+            os.makedirs(cache_dir, exist_ok=True)
+            _created_cache_dirs.add(cache_dir)
+    
+    def get_cache_path(self, dataset_name: str, bbox: Any, instance: Mapping[str, Any],
+                       keepDuplicates: bool, neighbourhood_size: int) -> str:
+        """
+        Generate cache file path for an explanation request.
+        
+        Parameters
+        ----------
+        dataset_name : str
+            Name of the dataset being explained.
+        bbox : Any
+            Black box model whose predictions label the neighborhood.
+        instance : Mapping[str, Any]
+            Ordered feature values of the instance.
+        keepDuplicates : bool
+            Whether duplicate samples are kept in the neighborhood.
+        neighbourhood_size : int
+            Number of samples to generate.
+            
+        Returns
+        -------
+        str
+            Full path to cache file.
+            
+        Notes
+        -----
+        The black box is identified by ``joblib.hash`` of the fitted model,
+        computed once per model object, so retraining with other parameters
+        or data never reuses another model's neighborhood.
+        """
+        if _bbox_digest["bbox"] is not bbox:
+            _bbox_digest.update(bbox=bbox, digest=joblib.hash(bbox))
+        request_repr = repr((
+            dataset_name, _bbox_digest["digest"], list(instance.items()),
+            bool(keepDuplicates), int(neighbourhood_size)
+        ))
+        request_hash = hashlib.blake2b(request_repr.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f'explanation_{dataset_name}_{request_hash}.pkl')
+    
+    def load(self, cache_path: str) -> Optional[Tuple[Tuple[Any, ...], Any]]:
+        """
+        Load a cached explanation if present.
+        
+        Parameters
+        ----------
+        cache_path : str
+            Path returned by ``get_cache_path``.
+            
+        Returns
+        -------
+        Optional[Tuple[Tuple[Any, ...], Any]]
+            The ``create_neighbourhood_with_lore`` result and the trained
+            surrogate, or None on a cache miss.
+        """
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            cached = joblib.load(cache_path)
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable explanation cache {cache_path}: {e}")
+            return None
+        logging.info(f"Loaded explanation from webapp cache: {cache_path}")
+        return cached
+    
+    def save(self, cache_path: str, neighbourhood: Tuple[Any, ...], surrogate: Any) -> None:
+        """
+        Store an explanation's neighborhood and trained surrogate.
+        
+        Parameters
+        ----------
+        cache_path : str
+            Path returned by ``get_cache_path``.
+        neighbourhood : Tuple[Any, ...]
+            Result of ``create_neighbourhood_with_lore``.
+        surrogate : Any
+            Surrogate trained on that neighborhood.
+            
+        Notes
+        -----
+        The pickle is written to a per-process temporary file and renamed
+        into place, so a crash or two identical concurrent requests never
+        leave a truncated entry for ``load`` to trip over.
+        """
+        root, extension = os.path.splitext(cache_path)
+        temporary_path = f'{root}.{os.getpid()}.tmp{extension}'
+        try:
+            joblib.dump((neighbourhood, surrogate), temporary_path, compress=CACHE_COMPRESSION)
+            os.replace(temporary_path, cache_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        logging.info(f"Cached explanation to: {cache_path}")
@@ -1,16 +1,32 @@
-from typing import Dict, Any, Tuple, Union
+from typing import Dict, Any, List, Tuple, Union
+import os
+import logging
+import joblib
+from types import MappingProxyType
+import sklearn.ensemble
+import sklearn.linear_model
+import sklearn.svm
+import sklearn.neighbors
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.svm import SVC
 from sklearn.neighbors import KNeighborsClassifier
 
+from .webapp_datasets import load_dataset
+
+_acceleration_installed = False
+
 CLASSIFIERS = {
     'RandomForestClassifier': {
         'n_estimators': 100,
+        'max_samples': 0.5,
         'max_depth': None,
         'min_samples_split': 2,
         'min_samples_leaf': 1,
         'random_state': 42,
+        # Trainer option, not a sklearn parameter: scale the number of trees
+        # to the training set, with n_estimators as the upper bound
+        'auto_size_forest': True,
     },
     'LogisticRegression': {
         'C': 1.0,
@@ -37,22 +53,89 @@ CLASSIFIERS = {
     }
 }
 
+# Read-only view handed out to API handlers, so request code cannot mutate
+# the shared defaults
+_CLASSIFIERS_RO = MappingProxyType({name: MappingProxyType(params) for name, params in CLASSIFIERS.items()})
+
 
-def get_available_classifiers() -> Dict[str, Dict[str, Any]]:
+def get_available_classifiers() -> 'MappingProxyType[str, MappingProxyType[str, Any]]':
     """
     Get available machine learning classifiers with their default parameters.
     
     Returns
     -------
-    Dict[str, Dict[str, Any]]
-        Dictionary mapping classifier names to their default parameter configurations.
+    MappingProxyType[str, MappingProxyType[str, Any]]
+        Read-only mapping from classifier names to their default parameter
+        configurations.
         
     Notes
     -----
     Provides standardized access to supported classifiers and their
-    sensible default hyperparameters for webapp integration.
+    sensible default hyperparameters for webapp integration. The same
+    immutable view is returned on every call, so callers can safely cache
+    anything derived from it.
+    """
+    return _CLASSIFIERS_RO
+
+
+def install_sklearn_acceleration() -> None:
+    """
+    Optionally route sklearn estimators through an accelerated backend.
+    
+    Notes
+    -----
+    Controlled by the ``LORE_ACCEL`` environment variable: ``"sklearnex"``
+    patches sklearn with Intel's oneDAL implementations and ``"cuml"``
+    installs cuML's GPU accelerator. Any other value leaves sklearn as is.
+    Runs once per process; a missing backend is logged and ignored.
+    """
+    global _acceleration_installed
+    if _acceleration_installed:
+        return
+    _acceleration_installed = True
+    
+    backend = os.environ.get("LORE_ACCEL", "").strip().lower()
+    if backend == "sklearnex":
+        try:
+            from sklearnex import patch_sklearn
+        except ImportError:
+            logging.warning("LORE_ACCEL=sklearnex but scikit-learn-intelex is not installed. "
+                            "Install it with: pip install scikit-learn-intelex")
+            return
+        patch_sklearn()
+    elif backend == "cuml":
+        try:
+            from cuml.accel import install
+        except ImportError:
+            logging.warning("LORE_ACCEL=cuml but cuML is not installed")
+            return
+        install()
+
+
+def split_trainer_options(parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+    """
+    Separate trainer options from the sklearn hyperparameters.
+    
+    Parameters
+    ----------
+    parameters : Dict[str, Any]
+        Parameters as posted by the client, possibly holding
+        ``auto_size_forest``.
+        
+    Returns
+    -------
+    Tuple[Dict[str, Any], bool]
+        Parameters to pass to the sklearn estimator, and whether the forest
+        is sized to the training set.
+        
+    Notes
+    -----
+    The parameter form posts edited values as text, so ``"true"`` enables
+    the option as well as ``True``.
     """
-    return CLASSIFIERS
+    parameters = dict(parameters)
+    auto_size_forest = parameters.pop('auto_size_forest', False)
+    return parameters, auto_size_forest is True or str(auto_size_forest).strip().lower() == 'true'
 
 
 def create_classifier(classifier_name: str, parameters: Dict[str, Any]) -> Union[
@@ -81,14 +164,20 @@ def create_classifier(classifier_name: str, parameters: Dict[str, Any]) -> Union
     Notes
     -----
     Factory function that instantiates the appropriate sklearn classifier
-    based on the provided name and configuration parameters.
+    based on the provided name and configuration parameters. Classes are
+    looked up on the sklearn modules after ``install_sklearn_acceleration``
+    so accelerated replacements are picked up when enabled. Trainer options
+    such as ``auto_size_forest`` are dropped before the estimator is built.
     """
+    install_sklearn_acceleration()
+    parameters, _ = split_trainer_options(parameters)
+    
     classifier_map = {
-        "RandomForestClassifier": RandomForestClassifier,
-        "LogisticRegression": LogisticRegression,
-        "SVC": SVC,
-        "KNeighborsClassifier": KNeighborsClassifier,
-        "GradientBoostingClassifier": GradientBoostingClassifier,
+        "RandomForestClassifier": sklearn.ensemble.RandomForestClassifier,
+        "LogisticRegression": sklearn.linear_model.LogisticRegression,
+        "SVC": sklearn.svm.SVC,
+        "KNeighborsClassifier": sklearn.neighbors.KNeighborsClassifier,
+        "GradientBoostingClassifier": sklearn.ensemble.GradientBoostingClassifier,
     }
     
     if classifier_name not in classifier_map:
@@ -122,13 +211,56 @@ def train_model_with_lore(dataset_name: str, classifier_name: str,
     Integrates classifier creation with LORE's caching system for
     efficient model training and reuse across explanation sessions.
     """
+    parameters, auto_size_forest = split_trainer_options(parameters)
     classifier = create_classifier(classifier_name, parameters)
 
     from .webapp_lore import load_cached_classifier
     trained_model, dataset, feature_names = load_cached_classifier(
         dataset_name=dataset_name,
         classifier=classifier,
-        classifier_name=classifier_name
+        classifier_name=classifier_name,
+        auto_size_forest=auto_size_forest
     )
 
     return trained_model, dataset, feature_names
+
+
+def train_models_with_lore(dataset_name: str, specs: List[Tuple[str, Dict[str, Any]]], 
+                           n_jobs: int = -1) -> None:
+    """
+    Train several classifiers on the same dataset concurrently.
+    
+    Parameters
+    ----------
+    dataset_name : str
+        Name of the dataset to train on.
+    specs : List[Tuple[str, Dict[str, Any]]]
+        Classifier names with their hyperparameters.
+    n_jobs : int, default=-1
+        Maximum number of worker processes (-1 uses all cores).
+        
+    Notes
+    -----
+    Each classifier is fitted in its own loky worker process, which writes
+    the trained model to the webapp cache. The workers' webapp_state is
+    discarded, so a following ``train_model_with_lore`` call for any of the
+    specs loads the model from the cache instead of retraining it. The
+    dataset is loaded once here first, so the workers read its cache file
+    instead of each fetching and writing it.
+    """
+    n_workers = min(len(specs), joblib.effective_n_jobs(n_jobs))
+    if n_workers <= 1:
+        for classifier_name, parameters in specs:
+            train_model_with_lore(dataset_name, classifier_name, parameters)
+        return
+    
+    load_dataset(dataset_name)
+    joblib.Parallel(n_jobs=n_workers, backend='loky')(
+        joblib.delayed(_train_in_worker)(dataset_name, classifier_name, parameters)
+        for classifier_name, parameters in specs
+    )
+
+
+def _train_in_worker(dataset_name: str, classifier_name: str, parameters: Dict[str, Any]) -> None:
+    """Train one classifier in a worker process, keeping only its cache entry."""
+    train_model_with_lore(dataset_name, classifier_name, parameters)
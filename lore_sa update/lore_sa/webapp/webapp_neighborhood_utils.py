@@ -0,0 +1,212 @@
+import numpy as np
+import logging
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Configure logging for numba (also used by UMAP)
+logging.getLogger('numba').setLevel(logging.WARNING)
+
+
+def _remove_duplicates_numpy(neighborhood: np.ndarray, instance: np.ndarray) -> np.ndarray:
+    """
+    Vectorized fallback for numeric neighborhoods when numba is not installed.
+
+    Parameters
+    ----------
+    neighborhood : np.ndarray
+        Encoded neighborhood samples (2D, numeric).
+    instance : np.ndarray
+        Encoded instance row (1D).
+
+    Returns
+    -------
+    np.ndarray
+        First occurrences of each distinct row, without copies of the
+        instance, followed by the instance as last row.
+
+    Notes
+    -----
+    Each row is viewed as one opaque ``np.void`` scalar, so ``np.unique``
+    sorts a 1D array of row blobs instead of comparing rows field by
+    field as with ``axis=0``. Float rows get ``+ 0.0`` first so that
+    ``-0.0`` and ``0.0`` share a byte pattern. ``np.unique`` sorts the
+    rows, so the returned first-occurrence indices are sorted again to
+    keep the generation order.
+    """
+    if neighborhood.shape[0] == 0:
+        return instance.reshape(1, -1).astype(neighborhood.dtype)
+
+    neighborhood = np.ascontiguousarray(neighborhood)
+    keys = neighborhood + 0.0 if np.issubdtype(neighborhood.dtype, np.floating) else neighborhood
+    row_blobs = keys.view(np.dtype((np.void, keys.dtype.itemsize * keys.shape[1]))).ravel()
+    _, first_indices = np.unique(row_blobs, return_index=True)
+    first_indices.sort()
+    unique_rows = neighborhood[first_indices]
+    unique_rows = unique_rows[~np.all(unique_rows == instance, axis=1)]
+
+    out = np.empty((unique_rows.shape[0] + 1, neighborhood.shape[1]), dtype=neighborhood.dtype)
+    out[:-1] = unique_rows
+    out[-1] = instance
+    return out
+
+
+def _remove_duplicates_python(neighborhood: np.ndarray, instance: np.ndarray) -> np.ndarray:
+    """
+    Python fallback for neighborhoods with object dtype.
+
+    Parameters
+    ----------
+    neighborhood : np.ndarray
+        Encoded neighborhood samples (2D).
+    instance : np.ndarray
+        Encoded instance row (1D).
+
+    Returns
+    -------
+    np.ndarray
+        First occurrences of each distinct row, without copies of the
+        instance, followed by the instance as last row.
+    """
+    out = np.empty((neighborhood.shape[0] + 1, instance.shape[0]), dtype=neighborhood.dtype)
+    seen = {tuple(instance)}
+    written = 0
+    for row in neighborhood:
+        row_tuple = tuple(row)
+        if row_tuple not in seen:
+            out[written] = row
+            written += 1
+            seen.add(row_tuple)
+    out[written] = instance
+    return out[:written + 1]
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _rows_equal(a: np.ndarray, b: np.ndarray) -> bool:
+        """Element-wise equality of two rows of the same length."""
+        for k in range(a.shape[0]):
+            if a[k] != b[k]:
+                return False
+        return True
+
+    @njit(cache=True)
+    def _row_hash(row: np.ndarray) -> int:
+        """FNV-style hash of a float row, consistent with ``_rows_equal``."""
+        h = 1469598103934665603
+        for k in range(row.shape[0]):
+            h = (h ^ hash(row[k])) * 1099511628211
+        return h
+
+    @njit(cache=True, parallel=True)
+    def _row_hashes(neighborhood: np.ndarray) -> np.ndarray:
+        """Hash every neighborhood row, rows processed in parallel."""
+        n = neighborhood.shape[0]
+        hashes = np.empty(n, np.int64)
+        for i in prange(n):
+            hashes[i] = _row_hash(neighborhood[i])
+        return hashes
+
+    @njit(cache=True)
+    def _remove_duplicates_numba(neighborhood: np.ndarray, instance: np.ndarray) -> np.ndarray:
+        """
+        Single pass deduplication with the instance moved to the last row.
+
+        Parameters
+        ----------
+        neighborhood : np.ndarray
+            Encoded neighborhood samples (2D, float64).
+        instance : np.ndarray
+            Encoded instance row (1D, float64).
+
+        Returns
+        -------
+        np.ndarray
+            First occurrences of each distinct row, without copies of the
+            instance, followed by the instance as last row.
+
+        Notes
+        -----
+        Uses an open addressing hash table of row indices, so the cost is
+        linear in the number of cells instead of quadratic in the number
+        of rows. Slot ``n`` of the index space refers to the instance.
+        Row hashes are computed up front in parallel; only the table
+        insertion, which must keep first occurrences, is sequential.
+        """
+        n, d = neighborhood.shape
+        size = 1
+        while size < 2 * (n + 1):
+            size <<= 1
+        mask = size - 1
+        table = np.full(size, -1, np.int64)
+        hashes = _row_hashes(neighborhood)
+
+        slot = _row_hash(instance) & mask
+        table[slot] = n
+
+        keep = np.empty(n, np.int64)
+        count = 0
+        for i in range(n):
+            row = neighborhood[i]
+            slot = hashes[i] & mask
+            duplicate = False
+            while table[slot] != -1:
+                j = table[slot]
+                other = instance if j == n else neighborhood[j]
+                if _rows_equal(row, other):
+                    duplicate = True
+                    break
+                slot = (slot + 1) & mask
+            if not duplicate:
+                table[slot] = i
+                keep[count] = i
+                count += 1
+
+        out = np.empty((count + 1, d), neighborhood.dtype)
+        for r in range(count):
+            out[r] = neighborhood[keep[r]]
+        out[count] = instance
+        return out
+
+
+def remove_duplicates_with_instance_last(neighborhood: np.ndarray, instance: np.ndarray) -> np.ndarray:
+    """
+    Remove duplicate neighborhood rows and place the instance at the end.
+
+    Parameters
+    ----------
+    neighborhood : np.ndarray
+        Encoded neighborhood samples.
+    instance : np.ndarray
+        Encoded instance the neighborhood was generated around.
+
+    Returns
+    -------
+    np.ndarray
+        Deduplicated neighborhood (first occurrences kept in order) whose
+        last row is the instance. Copies of the instance found among the
+        generated samples are dropped so the instance appears exactly once.
+
+    Notes
+    -----
+    Deduplication, instance membership and move-to-end are fused into a
+    single numba-compiled pass when numba is available (it is installed
+    alongside UMAP). Without numba, numeric neighborhoods are deduplicated
+    with ``np.unique`` and object arrays with a Python set.
+    """
+    neighborhood = np.asarray(neighborhood)
+    instance = np.asarray(instance).reshape(-1)
+
+    if not np.issubdtype(neighborhood.dtype, np.number):
+        return _remove_duplicates_python(neighborhood, instance)
+    if NUMBA_AVAILABLE:
+        return _remove_duplicates_numba(
+            np.ascontiguousarray(neighborhood, dtype=np.float64),
+            np.ascontiguousarray(instance, dtype=np.float64)
+        )
+    return _remove_duplicates_numpy(neighborhood, instance)
+